@@ -13,9 +13,7 @@ Functions:
 """
 
 # Import modules and libraries
-import copy
 from loguru import logger
-import os
 import pygame as pg
 
 import Input as inp
@@ -41,13 +39,18 @@ class Board:
         setPieces: Mutator method for the __pieces attribute.
         getKings: Accessor method for the __kings attribute.
         setKings: Mutator method for the __kings attribute.
+        setEpSquare: Mutator method for the __epSquare attribute.
+        getVersion: Accessor method for the __boardVersion and __movesVersion attributes.
         createVBoard: Return a virtual board made from the current board.
+        createSnapshot: Return a snapshot of every piece and its state, along with the en passant square.
+        restoreSnapshot: Return the board to a snapshot by restoring the same piece objects.
+        reset: Return the board to the starting position, reusing the original piece objects.
         getMoved: Accessor method for the __moved attribute.
         movedFalse: Mutator method for the __moved attribute to set it to False.
         getToPromote: Accessor method for the __toPromote attribute.
         toPromoteNone: Mutator method for the __toPromote attribute to set it to None.
         getDead: Accessor method for the __dead attribute.
-        deadNone: Mutator method for the __dead attribute to set it to None.
+        deadEmpty: Mutator method for the __dead attribute to set it to an empty list.
         getCheck: Return whether either king is being threatened.
         getCheckmate: Return whether there are no legal moves left and the current king is in check.
         getStalemate: Return whether there are no legal moves left and the current king is not in check.
@@ -57,7 +60,6 @@ class Board:
         update: Process the user input, update the pieces and any present move buttons, and return the output image.
 
     Attributes:
-        __pieceMoves (dict): A dictionary containing all possible moves for each piece.
         __board (list): The board list, which stores all pieces at their positions.
         __size (pg.Vector2): The board size in pixels.
         __pos (pg.Vector2): The board position in pixels.
@@ -75,17 +77,26 @@ class Board:
         __allMoves (list): A list of all current legal moves.
         __moved (bool): Whether or not a move has occurred yet this turn.
         __toPromote (None | pie.Pawn): A pawn to be promoted, if there is one.
-        __dead (None | tuple | list): All pieces which have died this turn.
+        __dead (list): The team and value of every piece which has died this turn.
+        __pseudoMoves (dict): The move bitboard of each piece from the last move update, before illegal moves were removed, keyed by piece.
+        __changedSquares (None | set): The indices of all squares whose contents have changed since the last move update, or None if every square should be treated as changed.
+        __pinned (int): A bitboard of the current team's pieces which are pinned to their king.
+        __checkers (int): A bitboard of the opposing pieces which are currently attacking the current team's king.
+        __boardVersion (int): A counter which is increased whenever the board changes.
+        __movesVersion (None | tuple): The board version and turn for which the legal moves were last updated.
+        __vBoardList (None | list): The flat list of encoded pieces from the last virtual board created.
+        __vBoardVersion (None | int): The board version for which the virtual board list was last created.
+        __check (bool): Whether the king of the last checked team was in check.
+        __checkVersion (None | tuple): The board version, moves version and team for which check was last checked.
+        __epSquare (None | int): The bitboard index of the square passed over by the last move if it was a pawn double move, which can be taken onto en passant.
+        __startSnapshot (tuple): The snapshot of the starting position, used to reset the board.
     """
 
-    # The moves of each piece should remain static, so it is being defined as a class attribute
-    # Where x means any non-zero number in that direction and mx means its negative
-    __pieceMoves: dict = {
-        5: [(x, y) for x in [-1, 0, 1] for y in [-1, 0, 1] if (x, y) != (0, 0)],
-        4: [("x", "x"), ("mx", "x"), (0, "x"), ("x", 0)],
-        3: [("x", "x"), ("mx", "x")],
-        2: [(x + z, y) if x == 0 else (x, y + z) for x in [-2, 0, 2] for y in [-2, 0, 2] if (x + y == 2 or x + y == -2) for z in [-1, 1]],
-        1: [("x", 0), (0, "x")]
+    # The line types (1 for orthogonal and 2 for diagonal) along which each sliding piece moves, keyed by value
+    __slideLines: dict = {
+        4: 3,
+        3: 2,
+        1: 1
     }
 
     # Initialise an object of this class when called
@@ -97,7 +108,7 @@ class Board:
         self.__pos: pg.Vector2 = pos
         self.__squareSize: pg.Vector2 = self.__size / 8
         self.__image: pg.surface.Surface = pg.surface.Surface(self.__size)
-        self.__chessboard: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Chessboard.png").convert_alpha(), self.__size)
+        self.__chessboard: pg.surface.Surface = inp.loadImage("Chessboard.png", tuple(self.__size))
 
         # Define all attributes related to the pieces, as well as populating these sprite groups with their objects
         # Define the sprite groups
@@ -133,7 +144,21 @@ class Board:
         self.__allMoves: list = []
         self.__moved: bool = False
         self.__toPromote: None | pie.Pawn = None
-        self.__dead: None | tuple | list = None
+        self.__dead: list = []
+
+        # Define the attributes which allow moves to be updated incrementally rather than from scratch every turn
+        self.__pseudoMoves: dict = {}
+        self.__changedSquares: None | set = None
+        self.__pinned: int = 0
+        self.__checkers: int = 0
+        self.__boardVersion: int = 0
+        self.__movesVersion: None | tuple = None
+        self.__vBoardList: None | list = None
+        self.__vBoardVersion: None | int = None
+        self.__check: bool = False
+        self.__checkVersion: None | tuple = None
+        self.__epSquare: None | int = None
+        self.__startSnapshot: tuple = self.createSnapshot()
         
         # Call the method to update the legal moves of all pieces
         self.updateMoves(False)
@@ -146,6 +171,9 @@ class Board:
     def setBoard(self, newBoard: list) -> None:
         """Set the board attribute to a new board."""
         self.__board = [column.copy() for column in newBoard]
+        # The whole board may have changed, so no stored moves can be trusted
+        self.__changedSquares = None
+        self.__boardVersion += 1
 
     def getSquareSize(self) -> pg.Vector2:
         """Return the square size attribute."""
@@ -162,6 +190,8 @@ class Board:
     def setPieces(self, newPieces: pg.sprite.Group) -> None:
         """Set the board attribute to the new board parameter."""
         self.__pieces = newPieces
+        self.__pseudoMoves = {}
+        self.__boardVersion += 1
     
     def getKings(self) -> pg.sprite.Group:
         """Return the kings attribute."""
@@ -171,15 +201,100 @@ class Board:
         """Set the board attribute to the new board parameter."""
         self.__kings = newKings
 
+    def setEpSquare(self, newEpSquare: None | int) -> None:
+        """Set the en passant square attribute to a new bitboard index."""
+        self.__epSquare = newEpSquare
+        self.__boardVersion += 1
+
+    def getVersion(self) -> tuple:
+        """Return the board version and moves version attributes, which between them change whenever the board or its legal moves do."""
+        return self.__boardVersion, self.__movesVersion
+
     def createVBoard(self, turn: bool):
-        """Return a virtual board made from the current board."""
+        """Return a virtual board made from the current board, only encoding the pieces again if the board has changed since the last one."""
         vBoard = VirtualBoard(turn)
 
+        # If the board has not changed, the list of the last virtual board is still correct, and since setBoard copies it, no virtual board can modify it
+        if self.__vBoardVersion == self.__boardVersion:
+            vBoard.setBoard(self.__vBoardList)
+            return vBoard
+
         # Encode all pieces into integers and place them on the virtual board array in their original positions
         [vBoard.placePiece(piece.getSquare(), piece.encodeInt()) for piece in self.__pieces]
 
+        # The virtual board stores en passant on the pawn which can be taken, so mark the pawn just beyond the en passant square as double moved
+        if self.__epSquare != None:
+            passed = self.__board[self.__epSquare % 8][self.__epSquare // 8 + 1]
+            vBoard.placePiece(passed.getSquare(), passed.encodeInt() + 4)
+
+        self.__vBoardList = vBoard.getBoard()
+        self.__vBoardVersion = self.__boardVersion
         return vBoard
 
+    def createSnapshot(self) -> tuple:
+        """Return a snapshot of the current position, made of every piece object paired with its saved state, and the en passant square."""
+        return tuple((piece, piece.saveState()) for piece in self.__pieces), self.__epSquare
+
+    def restoreSnapshot(self, snapshot: tuple) -> None:
+        """Return the board to the position of a snapshot.
+
+        Rather than decoding new pieces, the very same piece objects are put back into their saved states, so any piece which has since been taken
+        or promoted is simply added back, and any piece which has since been created by a promotion is dropped along with the old sprite groups.
+
+        Args:
+            snapshot (tuple): The snapshot, as returned by the createSnapshot method.
+
+        Kwargs:
+            None
+
+        Returns:
+            None
+        """
+        pieceStates, epSquare = snapshot
+        # Empty the old sprite groups so that the pieces do not keep them alive
+        self.__pieces.empty()
+        self.__kings.empty()
+
+        # Restore every piece, placing it back onto a fresh board list and into fresh sprite groups
+        # The group methods and King class are held in local variables since they are looked up for every piece
+        board = [[None] * 8 for x in range(8)]
+        pieces = pg.sprite.Group()
+        kings = pg.sprite.Group()
+        addPiece = pieces.add
+        addKing = kings.add
+        king = pie.King
+        for piece, state in pieceStates:
+            piece.restoreState(state)
+            board[state[0]][state[1]] = piece
+            addPiece(piece)
+            # King is never subclassed, so an exact type check is enough
+            if type(piece) is king:
+                addKing(piece)
+
+        # Replace the board's sprite groups, board list and en passant square with the restored ones
+        self.setBoard(board)
+        self.setPieces(pieces)
+        self.setKings(kings)
+        self.setEpSquare(epSquare)
+
+    def reset(self) -> None:
+        """Return the board to the starting position by restoring the starting snapshot, so that no pieces or images need to be created again."""
+        logger.info("Board reset")
+        self.restoreSnapshot(self.__startSnapshot)
+
+        # Reset all of the attributes to do with the actual turns
+        self.__specialMoves = []
+        self.__moveButtons.empty()
+        self.__selectedPiece = None
+        self.__allMoves = []
+        self.__moved = False
+        self.__toPromote = None
+        self.__dead = []
+        self.__pinned = 0
+        self.__checkers = 0
+        self.__movesVersion = None
+        self.updateMoves(False)
+
     def __updateAllMoves(self, turn: bool) -> None:
         """Set the all moves attribute to the list of all moves of the current team."""
         moveList = []
@@ -188,19 +303,24 @@ class Board:
         self.__allMoves = [move for moveset in moveList for move in moveset]
 
         # Remove moves from allmoves if they are illegal/would lead to the king being in check
-        # Start by creating a virtual board
-        vBoard = self.createVBoard(turn)
+        # The virtual board is only created once a move is found which actually needs to be simulated
+        vBoard = None
         illegal = []
         # Iterate through every move and decide whether or not to remove each
         for move in self.__allMoves:
-            if isinstance(move[0], pg.Vector2) and vBoard.getCheck(vBoard.fakeMove((move[1].getSquare(), move[0])), True):
+            # A regular move by a piece other than the king cannot expose the king unless it is already in check or the piece is pinned
+            if not (self.__checkers or isinstance(move[1], pie.King) or isinstance(move[0], tuple) or (self.__pinned >> pie.squareIndex(move[1].getSquare())) & 1):
+                continue
+            if vBoard == None:
+                vBoard = self.createVBoard(turn)
+            if isinstance(move[0], pg.Vector2) and vBoard.getCheck(vBoard.fakeMove((pie.squareIndex(move[1].getSquare()), pie.squareIndex(move[0]))), True):
                 move[1].removeLegalMove(move[0])
                 illegal.append(move)
-            elif isinstance(move[0], tuple) and vBoard.getCheck(vBoard.fakeMove((move[1].getSquare(), pg.Vector2(move[0][0], move[0][1]), move[0][2])), True):
+            elif isinstance(move[0], tuple) and vBoard.getCheck(vBoard.fakeMove((pie.squareIndex(move[1].getSquare()), move[0][1] * 8 + move[0][0], move[0][2])), True):
                 move[1].removeLegalMove(pg.Vector2(move[0][0], move[0][1]))
                 illegal.append(move)
         [self.__allMoves.remove(move) for move in illegal]
-        logger.debug(f"All legal moves are: {self.__allMoves}")
+        logger.debug("All legal moves are: {}", self.__allMoves)
 
     def getMoved(self) -> bool:
         """Return the moved attribute."""
@@ -218,26 +338,31 @@ class Board:
         """Set the to promote attribute to none."""
         self.__toPromote = None
 
-    def getDead(self) -> None | tuple | list:
+    def getDead(self) -> list:
         """Return the dead attribute."""
         return self.__dead
     
-    def deadNone(self) -> None:
-        """Set the dead attribute to none."""
-        self.__dead = None
+    def deadEmpty(self) -> None:
+        """Set the dead attribute to an empty list."""
+        self.__dead = []
     
     def getCheck(self, turn: bool) -> bool:
-        """Return whether either king is in check."""
-        return bool([None for king in self.__kings if king.getThreatened() and king.getTeam() == turn])
+        """Return whether the king of a team is in check, only looking at the kings again if the board or its moves have changed since the last check."""
+        # The kings' threatened attributes only change when the board changes or the moves are updated, so the last result stands until either does
+        checkVersion = (self.__boardVersion, self.__movesVersion, turn)
+        if self.__checkVersion != checkVersion:
+            self.__checkVersion = checkVersion
+            self.__check = bool([None for king in self.__kings if king.getThreatened() and king.getTeam() == turn])
+        return self.__check
 
     def getCheckmate(self, turn: bool) -> bool:
         """Return whether there are no legal moves left and the current king is in check."""
-        logger.debug(f"Checkmate is checked: {len(self.__allMoves) == 0 and self.getCheck(turn)}")
+        logger.opt(lazy=True).debug("Checkmate is checked: {}", lambda: len(self.__allMoves) == 0 and self.getCheck(turn))
         return len(self.__allMoves) == 0 and self.getCheck(turn)
     
     def getStalemate(self, turn: bool) -> bool:
         """Return whether there are no legal moves left and the current king is not in check."""
-        logger.debug(f"Stalemate is checked: {len(self.__allMoves) == 0 and not self.getCheck(turn)}")
+        logger.opt(lazy=True).debug("Stalemate is checked: {}", lambda: len(self.__allMoves) == 0 and not self.getCheck(turn))
         return len(self.__allMoves) == 0 and not self.getCheck(turn)
 
     def __spaceToPixel(self, square: pg.Vector2) -> pg.Vector2:
@@ -249,6 +374,15 @@ class Board:
         logger.debug("Board rotated")
         # List comprehension for greater efficiency, iterate through and rotate the position of every piece
         [piece.move(pg.Vector2(7, 7) - piece.getSquare()) for piece in self.__pieces]
+
+        # Rotate the stored moves and changed squares as well, since a rotation maps the square at index i to index 63 - i
+        # Only sliding pieces and knights have their moves stored, so every destination is a plain vector
+        self.__pseudoMoves = {piece: pie.rotateBitboard(moves) for piece, moves in self.__pseudoMoves.items()}
+        if self.__changedSquares != None:
+            self.__changedSquares = {63 - square for square in self.__changedSquares}
+        if self.__epSquare != None:
+            self.__epSquare = 63 - self.__epSquare
+        self.__boardVersion += 1
         
         # Reverse the rows and then columns (equivalent to a rotation) of the board list
         [row.reverse() for row in self.__board]
@@ -260,10 +394,11 @@ class Board:
         team = self.__toPromote.getTeam()
         self.__toPromote.kill()
         pieceValues = [pie.Queen, pie.Bishop, pie.Knight, pie.Rook]
-        logger.debug(f"Promote {self.__toPromote} to {pieceValues[value]}")
+        logger.debug("Promote {} to {}", self.__toPromote, pieceValues[value])
         promoted = pieceValues[value](self.__squareSize, destSquare, team)
         self.__pieces.add(promoted)
         self.__board[int(destSquare[0])][int(destSquare[1])] = promoted
+        self.__squareChanged(destSquare)
 
     # Define a method to handle the special moves
     def __handleSpecialMoves(self, sourceSquare: pg.Vector2, destSquare: pg.Vector2, piece: pie.Piece) -> None:
@@ -292,49 +427,54 @@ class Board:
                 # If the move is a castle, also move the corresponding rook
                 if specMove[0][2] == "lc":
                     logger.debug("Move the rook in the left castle")
-                    logger.success(f"{["White", "Black"][piece.getTeam()]} played {algebraicNotation(sourceSquare, destSquare, piece, "lc")}")
+                    logger.opt(lazy=True).success("{} played {}", lambda: pie.TEAM_NAMES[piece.getTeam()], lambda: algebraicNotation(sourceSquare, destSquare, piece, "lc"))
                     inSpecial = True
                     # The rook in question will be the piece at the bottom left square
                     self.__board[0][7].move(pg.Vector2(specMove[0][0] + 1, 7))
                     self.__board[specMove[0][0] + 1][7] = self.__board[0][7]
                     self.__board[0][7] = None
+                    self.__squareChanged(pg.Vector2(0, 7))
+                    self.__squareChanged(pg.Vector2(specMove[0][0] + 1, 7))
 
                 elif specMove[0][2] == "rc":
                     logger.debug("Move the rook in the right castle")
-                    logger.success(f"{["White", "Black"][piece.getTeam()]} played {algebraicNotation(sourceSquare, destSquare, piece, "rc")}")
+                    logger.opt(lazy=True).success("{} played {}", lambda: pie.TEAM_NAMES[piece.getTeam()], lambda: algebraicNotation(sourceSquare, destSquare, piece, "rc"))
                     inSpecial = True
                     # The rook in question will be the piece at the bottom right square
                     self.__board[7][7].move(pg.Vector2(specMove[0][0] - 1, 7))
                     self.__board[specMove[0][0] - 1][7] = self.__board[7][7]
                     self.__board[7][7] = None
+                    self.__squareChanged(pg.Vector2(7, 7))
+                    self.__squareChanged(pg.Vector2(specMove[0][0] - 1, 7))
 
-                # If the move was a pawn double move, set this attribute to True
+                # If the move was a pawn double move, the square it passed over can be taken onto en passant
                 elif specMove[0][2] == "d":
-                    logger.debug("Set the doubleMoved attribute to True")
-                    self.__selectedPiece.doubleMovedTrue()
+                    logger.debug("Set the en passant square to the square passed over")
+                    self.__epSquare = pie.squareIndex(destSquare) + 8
 
                 # Otherwise, it was an en passant so kill the passed pawn
                 else:
                     logger.debug("Kill the passed pawn in en passant")
-                    logger.success(f"{["White", "Black"][piece.getTeam()]} played {algebraicNotation(sourceSquare, destSquare, piece, "e")}")
+                    logger.opt(lazy=True).success("{} played {}", lambda: pie.TEAM_NAMES[piece.getTeam()], lambda: algebraicNotation(sourceSquare, destSquare, piece, "e"))
                     inSpecial = True
                     target = self.__board[int(destSquare.x)][int(destSquare.y) + 1]
-                    self.__dead = (target.getTeam(), target.getValue())
+                    self.__dead.append((target.getTeam(), target.getValue()))
                     target.kill()
                     self.__board[int(destSquare.x)][int(destSquare.y) + 1] = None
+                    self.__squareChanged(pg.Vector2(destSquare.x, destSquare.y + 1))
 
         if not inSpecial:
-            logger.success(f"{["White", "Black"][piece.getTeam()]} played {algebraicNotation(sourceSquare, destSquare, piece)}")
+            logger.opt(lazy=True).success("{} played {}", lambda: pie.TEAM_NAMES[piece.getTeam()], lambda: algebraicNotation(sourceSquare, destSquare, piece))
 
     # Define a method to handle the selected piece
-    def __handleSelectedPiece(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool, turn: bool) -> None:
+    def __handleSelectedPiece(self, events: inp.EventBundle, mousePos: pg.Vector2, leftMousePressed: bool, turn: bool) -> None:
         """If a piece is selected, update move buttons and if any are pressed, trigger the turn change.
 
         Update the selectedd piece's move buttons, and if any are pressed, change the turn.
         Update attributes, check whether the move needs to be handled specially, and rotate the board.
 
         Args:
-            events (list): The current frame's events queue.
+            events (inp.EventBundle): The current frame's classified events.
             mousePos (pg.Vector2): The current position of the mouse.
             leftMousePressed (bool): Whether or not the left mouse button is currently being pressed.
             turn (bool): The team whose turn it currently is.
@@ -350,7 +490,7 @@ class Board:
         # Check if any were pressed, and if so, handle a piece move
         for button in self.__moveButtons:
             if button.getPressed():
-                logger.debug(f"Selected piece button at {button.getPos()} was pressed")
+                logger.debug("Selected piece button at {} was pressed", button.getPos())
 
                 # Define and update attributes and variables
                 selectedPieceSquare = self.__selectedPiece.getPos().elementwise() / self.__squareSize
@@ -364,15 +504,18 @@ class Board:
                 # Kill the piece at that spot (if any) and add it to the dead pieces list
                 target = self.__board[int(destSquare.x)][int(destSquare.y)]
                 if target != None and target.getTeam() != turn:
-                    self.__dead = (target.getTeam(), target.getValue())
+                    self.__dead.append((target.getTeam(), target.getValue()))
                     target.kill()
 
-                # Call the method to handle the special moves list
+                # Call the method to handle the special moves list, having first cleared any en passant, since it only lasts for one move
+                self.__epSquare = None
                 self.__handleSpecialMoves(selectedPieceSquare, destSquare, self.__selectedPiece)
 
                 # Move the piece on the board array as well
                 self.__board[int(selectedPieceSquare.x)][int(selectedPieceSquare.y)] = None
                 self.__board[int(destSquare.x)][int(destSquare.y)] = self.__selectedPiece
+                self.__squareChanged(selectedPieceSquare)
+                self.__squareChanged(destSquare)
 
                 # If a piece has been moved, check if any on the farthest row are friendly pawns, and if so, put them up for promotion
                 for piece in range(len(self.__board)):
@@ -389,18 +532,141 @@ class Board:
 
                 self.__selectedPiece = None
 
+    def __squareChanged(self, square: pg.Vector2) -> None:
+        """Add a square to the changed squares attribute, unless every square is already being treated as changed, and increase the board version."""
+        self.__boardVersion += 1
+        if self.__changedSquares != None:
+            self.__changedSquares.add(pie.squareIndex(square))
+
+    def __isDirty(self, piece: pie.Piece, occupied: int) -> bool:
+        """Return whether a piece's moves may have changed since the last move update.
+
+        Pawns and kings are always updated, as their moves also depend on the turn, en passant and castling rights.
+        Other pieces only need updating if they have no stored moves, if they are standing on a changed square,
+        or if a changed square is one they could reach (for a knight) or see along one of their lines (for a sliding piece),
+        which is found by ANDing the bitboard of the squares between them with the occupied bitboard.
+
+        Args:
+            piece (pie.Piece): The piece whose moves are being checked.
+            occupied (int): A bitboard of all occupied squares.
+
+        Kwargs:
+            None
+
+        Returns:
+            Whether or not the piece's moves need to be updated.
+        """
+        value = piece.getValue()
+        if value in (0, 5) or self.__changedSquares == None or piece not in self.__pseudoMoves:
+            return True
+
+        square = pie.squareIndex(piece.getSquare())
+        for changed in self.__changedSquares:
+            if changed == square:
+                return True
+            # Knights are affected by a change on any square a knight's move away
+            if value == 2:
+                if (pie.KNIGHT_ATTACKS[square] >> changed) & 1:
+                    return True
+            # Sliding pieces are affected by a change on any of their lines with nothing in between
+            elif (pie.LINE_TYPES[square][changed] & self.__slideLines[value]) and not (pie.BETWEEN[square][changed] & occupied):
+                return True
+        return False
+
+    def __updatePins(self, turn: bool, codes: list) -> None:
+        """Update the pinned and checkers bitboards for the king of the current team, using the encoded board to test the pieces along each line."""
+        self.__pinned = 0
+        self.__checkers = 0
+        for king in self.__kings:
+            if king.getTeam() == turn:
+                kingSquare = king.getSquare()
+
+                # Any opposing piece with a move onto the king's square is giving check
+                kingIndex = pie.squareIndex(kingSquare)
+                for piece in self.__pieces:
+                    if piece.getTeam() != turn and (piece.getMoveBitboard() >> kingIndex) & 1:
+                        self.__checkers |= 1 << pie.squareIndex(piece.getSquare())
+
+                # Look along every line from the king, and if the first piece is friendly and the second is an opposing piece which slides along that line, the first is pinned
+                for dx, dy in pie.DIRECTIONS:
+                    x = int(kingSquare.x) + dx
+                    y = int(kingSquare.y) + dy
+                    shield = None
+                    while 0 <= x <= 7 and 0 <= y <= 7:
+                        target = codes[y * 8 + x]
+                        if target != None:
+                            if shield == None and target % 2 == turn:
+                                shield = y * 8 + x
+                            else:
+                                if shield != None and target % 2 != turn and target // 10 in self.__slideLines and self.__slideLines[target // 10] & (2 if dx and dy else 1):
+                                    self.__pinned |= 1 << shield
+                                break
+                        x += dx
+                        y += dy
+
     def updateMoves(self, turn: bool) -> None:
-        """Update the _legalMoves attributes of all pieces, followed by the __allMoves attribute."""
+        """Update the _legalMoves attributes of all pieces, followed by the __allMoves attribute, unless they are already up to date."""
+        # Nothing needs regenerating if the board has not changed since the last update for this turn
+        if self.__movesVersion == (self.__boardVersion, turn):
+            return
+        self.__movesVersion = (self.__boardVersion, turn)
+
         # Set each king's threatened attribute back to False
         [king.threatenedFalse() for king in self.__kings]
-        # Update every piece"s legal move list
-        [piece.updateLegalMoves(self.__pieceMoves, self.__board, turn) for piece in self.__pieces]
-        # Compile a list of all moves which might block castling from occurring
-        castleBlockers = [move[0] for piece in self.__pieces for move in piece.getLegalMoves() if ((move[0][1] == 0) and (piece.getTeam() == turn)) or ((move[0][1] == 7) and (piece.getTeam() != turn))]
+        # Encode every piece once into a flat integer board indexed by bitboard index, and build the occupancy of each team alongside it
+        codes = [None] * 64
+        occupancy = [0, 0]
+        pawns = [0, 0]
+        unmovedPawns = [0, 0]
+        for piece in self.__pieces:
+            index = pie.squareIndex(piece.getSquare())
+            code = piece.encodeInt()
+            codes[index] = code
+            occupancy[piece.getTeam()] |= 1 << index
+            if code < 10:
+                pawns[code % 2] |= 1 << index
+                if not code & pie.MOVED_EVER_BIT:
+                    unmovedPawns[code % 2] |= 1 << index
+        occupied = occupancy[0] | occupancy[1]
+        # Mark the pawn which can be taken en passant as double moved, so that the position is told apart from the same one without the en passant
+        if self.__epSquare != None:
+            codes[self.__epSquare + 8] += 4
+
+        # Find the moves of every pawn on each team at once, which each pawn will then take its own moves from
+        pawnMoves = {}
+        for team in (False, True):
+            pawnMoves.update(pie.updateSidePawns(team, turn, pawns[team], unmovedPawns[team], occupancy, self.__epSquare))
+
+        # The encoded board is also the key of this position in the piece move cache
+        position = tuple(codes)
+
+        # Update the legal move list of every piece whose moves may have changed, and reuse the stored moves of the rest
+        pseudoMoves = {}
+        for piece in self.__pieces:
+            if self.__isDirty(piece, occupied):
+                piece.updateLegalMoves(self.__board, turn, position, occupancy, pawnMoves)
+            else:
+                piece.setLegalMoves(self.__pseudoMoves[piece])
+                # Reapply any threat to a king which would have been found by the full update
+                for king in self.__kings:
+                    if (self.__pseudoMoves[piece] >> pie.squareIndex(king.getSquare())) & 1:
+                        king.threatenedTrue()
+            if piece.getValue() not in (0, 5):
+                pseudoMoves[piece] = piece.getMoveBitboard()
+        self.__pseudoMoves = pseudoMoves
+        self.__changedSquares = set()
+        # Compile a bitboard of all moves which might block castling from occurring, on the back row of each team
+        castleBlockers = 0
+        for piece in self.__pieces:
+            castleBlockers |= piece.getMoveBitboard() & (0xFF if piece.getTeam() == turn else 0xFF << 56)
         # Remove any castle moves if they pass through attacked squares
         for king in self.__kings:
-            castles = [move[0] for move in king.getLegalMoves() if isinstance(move[0], tuple)]
-            [king.removeLegalMove(pg.Vector2(castle[0], castle[1])) for castle in castles for x in range(int(min(castle[0], king.getSquare().x)), int(max(castle[0], king.getSquare().x) + 1)) if pg.Vector2(x, castle[1]) in castleBlockers]
+            kingIndex = pie.squareIndex(king.getSquare())
+            # The only flagged king moves are castles, and each passes over every square from the king to its destination inclusive
+            for index in list(king.getMoveFlags()):
+                if castleBlockers & (pie.BETWEEN[kingIndex][index] | (1 << kingIndex) | (1 << index)):
+                    king.removeLegalMove(pg.Vector2(index % 8, index // 8))
+        self.__updatePins(turn, codes)
         self.__updateAllMoves(turn)
 
     # Define a method to create move buttons if any need to be created
@@ -423,7 +689,7 @@ class Board:
                   for move in moveOptions]
 
     # Define a method to update the board
-    def update(self, turn: bool, events: list, mousePos: pg.Vector2, leftMousePressed: bool) -> pg.surface.Surface:
+    def update(self, turn: bool, events: inp.EventBundle, mousePos: pg.Vector2, leftMousePressed: bool) -> pg.surface.Surface:
         """Process the user input, update the pieces and any present move buttons, alter some attributes and return the output image.
 
         Draw the board, take care of any potential promotions, update all selected pieces, and if none are selected then update every piece,
@@ -431,7 +697,7 @@ class Board:
 
         Args:
             turn (bool): The team whose turn it currently is.
-            events (list): The current frame's events queue.
+            events (inp.EventBundle): The current frame's classified events.
             mousePos (pg.Vector2): The current position of the mouse.
             leftMousePressed (bool): Whether or not the left mouse button is currently being pressed.
 
@@ -442,7 +708,7 @@ class Board:
             The board image to be displayed on the PlayGame object's image.
         """
         # Draw the chessboard base before handling all of the pieces
-        self.__image.blit(self.__chessboard, pg.Vector2(0, 0))
+        self.__image.blit(self.__chessboard, (0, 0))
 
         # If there is to be a promotion, do not update anything until the promotion has been decided
         if self.__toPromote == None:
@@ -461,7 +727,7 @@ class Board:
                 self.__handleSelectedPiece(events, mousePos, leftMousePressed, turn)
                 
         # Draw the pieces
-        self.__pieces.draw(self.__image)
+        pie.Piece.batchRender(self.__image, self.__pieces)
         # Draw the piece"s move buttons
         self.__moveButtons.draw(self.__image)
         return self.__image
@@ -490,36 +756,25 @@ class VirtualBoard:
         getCheck: Return whether the active king is being threatened.
 
     Attributes:
-        __pieceMoves (dict): A dictionary containing all possible moves for each piece.
-        __board (list): The board list which stores all piece integers at their positions.
+        __board (list): The flat board list which stores all piece integers at their bitboard indices, so that a square (x, y) is at index y * 8 + x.
         __turn (bool): The current turn.
     """
 
-    # The moves of each piece should remain static, so it is being defined as a class attribute
-    # Where x means any non-zero number in that direction and mx means its negative
-    __pieceMoves: dict = {
-        5: [(x, y) for x in [-1, 0, 1] for y in [-1, 0, 1] if (x, y) != (0, 0)],
-        4: [("x", "x"), ("mx", "x"), (0, "x"), ("x", 0)],
-        3: [("x", "x"), ("mx", "x")],
-        2: [(x + z, y) if x == 0 else (x, y + z) for x in [-2, 0, 2] for y in [-2, 0, 2] if (x + y == 2 or x + y == -2) for z in [-1, 1]],
-        1: [("x", 0), (0, "x")]
-    }
-
     # Initialise an object of this class when called
     def __init__(self, turn: bool) -> None:
         logger.info("VirtualBoard created")
         # Define attributes
-        self.__board: list = [[None] * 8 for y in range(8)]
+        self.__board: list = [None] * 64
         self.__turn: bool = turn
 
     def getBoard(self) -> list:
         """Return the board attribute."""
-        # As __board is multidimensional, return a deep copy so that there are no array modifier side effects
-        return copy.deepcopy(self.__board)
+        # As __board is a flat list of integers, a shallow copy is enough to avoid any array modifier side effects
+        return self.__board.copy()
     
     def setBoard(self, newBoard: list) -> None:
         """Set the board attribute to a new board."""
-        self.__board = copy.deepcopy(newBoard)
+        self.__board = newBoard.copy()
     
     def getTurn(self) -> bool:
         """Return the turn attribute."""
@@ -527,22 +782,20 @@ class VirtualBoard:
     
     def getAllMoves(self, turn: None | bool=None, board: bool | list=False) -> list:
         """Return a list of all possible moves."""
-        # If board was not passed, use the board attribute
+        # If board was not passed, use the board attribute, which is only read so does not need copying
         if not board:
-            board = copy.deepcopy(self.__board)
+            board = self.__board
         # If turn was not passed, use the turn attribute
         if turn == None:
             turn = self.__turn
-        allMoves = []
-        # Iterate through every board square and append the results of running either update piece moves or update regular moves
-        [allMoves.append(pie.updateRegularMoves(turn, pg.Vector2(x, y), piece, self.__pieceMoves[piece // 10], board)) if piece >= 10 else allMoves.append(pie.updatePawnMoves(turn, turn, pg.Vector2(x, y), piece, board)) for x, column in enumerate(board) for y, piece in enumerate(column) if piece != None and piece % 2 == turn]
-        return [move for moveset in allMoves for move in moveset]
+        # The moves are cached by position, so take a list copy which the caller is free to modify
+        return list(pie.generateAllMoves(tuple(board), turn))
     
     def getAllLegalMoves(self, turn: None | bool=None, board: bool | list=False) -> list:
         """Return a list of all legal moves."""
-        # If board was not passed, use the board attribute
+        # If board was not passed, use the board attribute, which is only read so does not need copying
         if not board:
-            board = copy.deepcopy(self.__board)
+            board = self.__board
         # If turn was not passed, use the turn attribute
         if turn == None:
             turn = self.__turn
@@ -556,20 +809,19 @@ class VirtualBoard:
     
     def placePiece(self, square: pg.Vector2, piece: int | pie.Piece) -> None:
         """Place a piece at the specified index on the board."""
-        self.__board[int(square.x)][int(square.y)] = piece
+        self.__board[int(square.y) * 8 + int(square.x)] = piece
 
     def rotateBoard(self) -> None:
         """Rotate the board array if it is a different player's turn."""
         logger.debug("Virtual board array rotated")
-        # Reverse the rows and then columns (equivalent to a rotation) of the board list
-        [row.reverse() for row in self.__board]
+        # A rotation maps the square at index i to index 63 - i, which is simply a reversal of the flat board list
         self.__board.reverse()
 
     def fakeMove(self, move: tuple, promote: int=4) -> list:
         """Return the results of a move made on the current board.
         
-        The format of the move parameter is a tuple, containing first the starting position,
-        then the ending position, and finally any special flags where necessary.
+        The format of the move parameter is a tuple, containing first the bitboard index of the starting square,
+        then that of the ending square, and finally any special flags where necessary.
         The move is assumed to be acting on a piece whose turn it currently is, but there are no checks for this.
 
         Args:
@@ -581,50 +833,49 @@ class VirtualBoard:
         Returns:
             The new board list after this move has been made.
         """
-        # Take a deep copy, since this is a 2D list, meaning that a simple shallow copy would contain the component lists still as pointers
-        board = copy.deepcopy(self.__board)
+        # Take a copy, which can be shallow since the board is a flat list of integers
+        board = self.__board.copy()
+        start, end = move[0], move[1]
 
         # Deal with the simplest part - moving the piece in question
-        board[int(move[1].x)][int(move[1].y)] = board[int(move[0].x)][int(move[0].y)]
-        board[int(move[0].x)][int(move[0].y)] = None
+        board[end] = board[start]
+        board[start] = None
 
         # If the piece has a moved ever attribute, add 2 if it has not already been moved
-        if (board[int(move[1].x)][int(move[1].y)] // 10 in (0, 1, 5)) and (((board[int(move[1].x)][int(move[1].y)] % 10) // 2) % 2 == 0):
-            board[int(move[1].x)][int(move[1].y)] += 2
+        if (board[end] // 10 in (0, 1, 5)) and not (board[end] % 10) & pie.MOVED_EVER_BIT:
+            board[end] += 2
 
         # Reset all double moved attributes
-        for x, column in enumerate(board):
-            for y, piece in enumerate(column):
-                if piece != None and piece // 10 == 0:
-                    board[x][y] %= 4
+        for index, piece in enumerate(board):
+            if piece != None and piece // 10 == 0:
+                board[index] %= 4
 
         # Deal with any specialty if there is any
         if len(move) == 3:
             # Left castle
             if move[2] == "lc":
-                board[int(move[1].x) + 1][7] = board[0][7]
-                board[0][7] = None
+                board[end + 1] = board[56]
+                board[56] = None
 
             # Right castle
             if move[2] == "rc":
-                board[int(move[1].x) - 1][7] = board[7][7]
-                board[7][7] = None
+                board[end - 1] = board[63]
+                board[63] = None
 
             # Double pawn move
             if move[2] == "d":
-                board[int(move[1].x)][int(move[1].y)] += 4
+                board[end] += 4
 
             # En passant
             else:
-                board[int(move[1].x)][int(move[0].y)] = None
+                board[(start // 8) * 8 + end % 8] = None
 
         # Handle any possible promotions
-        for x, column in enumerate(board):
-            if column[0] != None and column[0] < 10:
-                board[x][0] = promote * 10 + column[0]
+        for index in range(8):
+            if board[index] != None and board[index] < 10:
+                board[index] += promote * 10
 
         # Rotate the board
-        [row.reverse() for row in board]
         board.reverse()
         return board
 
@@ -634,8 +885,8 @@ class VirtualBoard:
     def makeMove(self, move: tuple, promote: int=4) -> None:
         """Make a move on the current board.
         
-        The format of the move parameter is a tuple, containing first the starting position,
-        then the ending position, and finally any special flags where necessary.
+        The format of the move parameter is a tuple, containing first the bitboard index of the starting square,
+        then that of the ending square, and finally any special flags where necessary.
         The move is assumed to be acting on a piece whose turn it currently is, but there are no checks for this.
 
         Args:
@@ -648,44 +899,45 @@ class VirtualBoard:
             None
         """
         logger.debug("VirtualBoard move made")
+        start, end = move[0], move[1]
+
         # Deal with the simplest part - moving the piece in question
-        self.__board[int(move[1].x)][int(move[1].y)] = self.__board[int(move[0].x)][int(move[0].y)]
-        self.__board[int(move[0].x)][int(move[0].y)] = None
+        self.__board[end] = self.__board[start]
+        self.__board[start] = None
 
         # If the piece has a moved ever attribute, add 2 if it has not already been moved
-        if (self.__board[int(move[1].x)][int(move[1].y)] // 10 in (0, 1, 5)) and (((self.__board[int(move[1].x)][int(move[1].y)] % 10) // 2) % 2 == 0):
-            self.__board[int(move[1].x)][int(move[1].y)] += 2
+        if (self.__board[end] // 10 in (0, 1, 5)) and not (self.__board[end] % 10) & pie.MOVED_EVER_BIT:
+            self.__board[end] += 2
 
         # Reset all double moved attributes
-        for x, column in enumerate(self.__board):
-            for y, piece in enumerate(column):
-                if piece != None and piece // 10 == 0:
-                    self.__board[x][y] %= 4
+        for index, piece in enumerate(self.__board):
+            if piece != None and piece // 10 == 0:
+                self.__board[index] %= 4
 
         # Deal with any specialty if there is any
         if len(move) == 3:
             # Left castle
             if move[2] == "lc":
-                self.__board[int(move[1].x) + 1][7] = self.__board[0][7]
-                self.__board[0][7] = None
+                self.__board[end + 1] = self.__board[56]
+                self.__board[56] = None
 
             # Right castle
             if move[2] == "rc":
-                self.__board[int(move[1].x) - 1][7] = self.__board[7][7]
-                self.__board[7][7] = None
+                self.__board[end - 1] = self.__board[63]
+                self.__board[63] = None
 
             # Double pawn move
             if move[2] == "d":
-                self.__board[int(move[1].x)][int(move[1].y)] += 4
+                self.__board[end] += 4
 
             # En passant
             else:
-                self.__board[int(move[1].x)][int(move[0].y)] = None
+                self.__board[(start // 8) * 8 + end % 8] = None
 
         # Handle any possible promotions
-        for x, column in enumerate(self.__board):
-            if column[0] != None and column[0] < 10:
-                self.__board[x][0] = promote * 10 + column[0]
+        for index in range(8):
+            if self.__board[index] != None and self.__board[index] < 10:
+                self.__board[index] += promote * 10
 
         # Rotate the board
         self.rotateBoard()
@@ -697,7 +949,7 @@ class VirtualBoard:
         """Return a tuple containing lists of all pieces organised into white and black teams only containing value, for quick material analysis."""
         white = []
         black = []
-        [[white, black][piece % 2].append(piece // 10) for column in self.__board for piece in column if piece != None]
+        [[white, black][piece % 2].append(piece // 10) for piece in self.__board if piece != None]
 
         return (white, black)
     
@@ -706,11 +958,12 @@ class VirtualBoard:
         # The simulated turn is the stored turn XORed with the turn offset, since if there is an offset the turn is flipped
         turn = self.__turn ^ turnOffset
 
+        # The board is only read, so there is no need to copy it
         if not board:
-            board = copy.deepcopy(self.__board)
-        
-        # Return whether or not the list of all moves whose destinations intersect the king is empty
-        return bool([None for move in self.getAllMoves(turn, board) if (board[int(move[1].x)][int(move[1].y)] != None) and (board[int(move[1].x)][int(move[1].y)] % 2 != turn) and (board[int(move[1].x)][int(move[1].y)] // 10 == 5)])
+            board = self.__board
+
+        # Rather than generating every move to see if any intersect the king, check the squares the king could be attacked from directly
+        return pie.kingAttacked(board, turn)
     
 
 # Define a function to
@@ -1,7 +1,7 @@
 """The ADT which stores a chess gamestate.
 
 This module contains the Frame class, and is to be used within the PlayGame and Stack modules.
-It holds all aspects of the current gamestate, namely a virtual board and the dead lists.
+It holds all aspects of the current gamestate, namely a snapshot of the board's pieces and the dead lists.
 
 Classes:
     Frame: The current gamestate storage ADT.
@@ -14,8 +14,6 @@ Functions:
 from loguru import logger
 import pygame as pg
 
-import Board as boa
-
 
 # Create the frame class
 class Frame:
@@ -24,28 +22,31 @@ class Frame:
     This class stores every useful element of a gamestate to allow for it to be returned to upon usage of the undo button.
 
     Constructor:
-        __init__(board (boa.VirtualBoard), dead (list)): Initialise self and attributes.
+        __init__(snapshot (tuple), dead (list)): Initialise self and attributes.
 
     Public methods:
-        getBoard: Accessor method for the __board attribute.
+        getSnapshot: Accessor method for the __snapshot attribute.
         getDead: Accessor method for the __dead attribute.
         getAll: Accessor method for both attributes.
 
     Attributes:
-        __board (list): Contains the board list from the Board class.
+        __snapshot (tuple): Contains the snapshot of every piece object and its state, and the en passant square, from the Board class.
         __dead (list): Contains the dead pieces list from the PlayGame class.
     """
+
+    # Declare the attributes as slots, since a frame is stored for every move
+    __slots__: tuple = ("__snapshot", "__dead")
     
     # Initialise an object of this class when called
-    def __init__(self, board: boa.VirtualBoard, dead: list):
+    def __init__(self, snapshot: tuple, dead: list):
         logger.info("Frame created")
         # Define attributes
-        self.__board: boa.VirtualBoard = board
+        self.__snapshot: tuple = snapshot
         self.__dead: list = dead
 
-    def getBoard(self) -> list:
-        """Return the __board attribute."""
-        return self.__board
+    def getSnapshot(self) -> tuple:
+        """Return the __snapshot attribute."""
+        return self.__snapshot
     
     def getDead(self) -> list:
         """Return the __dead attribute."""
@@ -54,5 +55,5 @@ class Frame:
     def getAll(self) -> tuple:
         """Return a tuple of both attributes."""
         logger.debug("Frame retrieved")
-        return self.__board, self.__dead
+        return self.__snapshot, self.__dead
     
\ No newline at end of file
@@ -14,6 +14,7 @@ Functions:
 from loguru import logger
 import pygame as pg
 
+import Input as inp
 import Menu as men
 import PlayGame as pla
 
@@ -66,18 +67,20 @@ class Game:
             self.__state = False
             self.__playGame.gameOverFalse()
 
-    def update(self, events: list, screen: pg.surface.Surface) -> None:
-        """Handle the updating and switching of game states, as well as drawing their image onto the screen.
+    def update(self, events: inp.EventBundle, screen: pg.surface.Surface, mousePos: pg.Vector2, leftMousePressed: bool) -> list:
+        """Handle the updating and switching of game states, as well as drawing the parts of their image which have changed onto the screen.
 
         Args:
-            events (list): The event queue of the current cycle.
+            events (inp.EventBundle): The classified events of the current cycle.
             screen (pg.surface.Surface): The screen that will be displayed in the current cycle.
+            mousePos (pg.Vector2): The position of the mouse in the current cycle.
+            leftMousePressed (bool): Whether or not the left mouse button is being pressed in the current cycle.
 
         Kwargs:
             None
         
         Returns:
-            None
+            The list of rects of the screen which have changed.
         """
         # Decide which set of state and swapper are used based on the current state
         if self.__state:
@@ -87,6 +90,13 @@ class Game:
             state = self.__menu
             swapper = self.__swapFromMenu
 
-        # Update the current state and check for any changes
-        screen.blit(state.update(events, pg.mouse.get_pos(), pg.mouse.get_pressed()[0]), (0, 0))
+        # Update the current state, drawing only the regions of its image which may have changed onto the screen, and check for any changes
+        # The menu is always drawn in full, while the play game state keeps track of its own changed regions
+        image = state.update(events, mousePos, leftMousePressed)
+        if self.__state:
+            dirtyRects = self.__playGame.getDirtyRects()
+        else:
+            dirtyRects = [screen.get_rect()]
+        screen.blits([(image, rect, rect) for rect in dirtyRects], doreturn=False)
         swapper()
+        return dirtyRects
@@ -6,19 +6,86 @@ and the classes in the Piece module inherit from the Switch class. These are sta
 whose dimensions and images in each state must be passed upon creation. They inherit from the pygame Sprite class.
 
 Classes:
+    EventBundle: The quit and left mouse button events of a frame, classified once for the main loop and every input to share.
     Input: The abstract base class from which the other two inherit.
     Button: An interactable screen-object with two states: pressed and released.
     Switch: An interactable screen-object with many states: a pressed state, and multiple released states which are cycled through upon press and release.
 
 Functions:
-    None
+    loadImage: Return an image from the assets folder scaled to a size, loading and scaling it only once.
+    loadButtonImages: Return the idle, hovering and clicked images of a button from the assets folder, creating them only once.
 """
 
 # Import modules and libraries
+from functools import lru_cache
 from loguru import logger
+import os
 import pygame as pg
 
 
+# The folder which holds every image asset, found once rather than on every load
+ASSETS_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Assets")
+
+
+# Create the event bundle class
+class EventBundle:
+    """The events queue of a single frame, classified in one pass so that neither the main loop nor every input needs to scan the whole queue.
+
+    The inputs only respond to the left mouse button, so only the types of its press and release events are kept, in the order they occurred,
+    along with whether there were any of each, since this is all most checks need, and whether the game was quit.
+
+    Constructor:
+        __init__(events (list)): Initialise self and attributes.
+
+    Public methods:
+        getLeftEvents: Accessor method for the __leftEvents attribute.
+        getLeftDown: Accessor method for the __leftDown attribute.
+        getLeftUp: Accessor method for the __leftUp attribute.
+        getQuit: Accessor method for the __quit attribute.
+
+    Attributes:
+        __leftEvents (tuple): The types of all left mouse button press and release events, in order.
+        __leftDown (bool): Whether the left mouse button was pressed this frame.
+        __leftUp (bool): Whether the left mouse button was released this frame.
+        __quit (bool): Whether the game was quit this frame.
+    """
+
+    # Declare the attributes as slots, since a bundle is created every frame
+    __slots__: tuple = ("__leftEvents", "__leftDown", "__leftUp", "__quit")
+
+    # Initialise an object of this class when called
+    def __init__(self, events: list) -> None:
+        # Sort the events in a single pass, keeping only the ones which are ever responded to
+        leftEvents = []
+        self.__quit: bool = False
+        for event in events:
+            if event.type == pg.QUIT:
+                self.__quit = True
+            elif event.type in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP) and event.button == pg.BUTTON_LEFT:
+                leftEvents.append(event.type)
+
+        # Define attributes
+        self.__leftEvents: tuple = tuple(leftEvents)
+        self.__leftDown: bool = pg.MOUSEBUTTONDOWN in self.__leftEvents
+        self.__leftUp: bool = pg.MOUSEBUTTONUP in self.__leftEvents
+
+    def getLeftEvents(self) -> tuple:
+        """Return the left events attribute."""
+        return self.__leftEvents
+
+    def getLeftDown(self) -> bool:
+        """Return the left down attribute."""
+        return self.__leftDown
+
+    def getLeftUp(self) -> bool:
+        """Return the left up attribute."""
+        return self.__leftUp
+
+    def getQuit(self) -> bool:
+        """Return the quit attribute."""
+        return self.__quit
+
+
 # Create the input abstract class
 class Input(pg.sprite.Sprite):
     """The abstract base class which dictates the overall behaviour of the Button and Switch.
@@ -48,7 +115,7 @@ class Input(pg.sprite.Sprite):
 
     # Initialise an object of this class when called
     def __init__(self, size: pg.Vector2, pos: pg.Vector2, idle: pg.surface.Surface | list, hovering: pg.surface.Surface, clicked: pg.surface.Surface) -> None:
-        logger.info(f"{type(self)} created")
+        logger.info("{} created", type(self))
         super().__init__()
         # Define attributes
         self._size: pg.Vector2 = size
@@ -90,7 +157,7 @@ class Input(pg.sprite.Sprite):
         """Abstract method to select the image."""
         pass
 
-    def update(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
+    def update(self, events: EventBundle, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
         """Abstract update method."""
         pass
 
@@ -128,14 +195,14 @@ class Button(Input):
         self.image = self._images[state]
 
     # Overwrite the update method
-    def update(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
+    def update(self, events: EventBundle, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
         """Update the _pressed and image attributes based on mouse position, mouse pressed, and the events queue.
 
         Use the events queue, mouse position and mouse pressed parameters to decide whether the button has been pressed,
         as well as which state it should appear in, out of possible options idle, hovering and clicked.
 
         Args:
-            events (list): The current frame's events queue.
+            events (EventBundle): The current frame's classified events.
             mosePos (pg.Vector2): The position of the mouse as a vector.
             leftMousePressed (bool): Whether or not the left mouse button is currently being pressed down.
 
@@ -148,16 +215,14 @@ class Button(Input):
         # If the mouse is hovering over the button, its state should either be clicked or hovering
         if self.rect.collidepoint(mousePos):
             # If the mouse is clicked, change state, and if it is released, assign the pressed attribute to True
-            for event in events:
+            for eventType in events.getLeftEvents():
 
-                if event.type == pg.MOUSEBUTTONDOWN:
-                    if event.button == pg.BUTTON_LEFT:
-                        self.setImage("clicked")
-                        return
+                if eventType == pg.MOUSEBUTTONDOWN:
+                    self.setImage("clicked")
+                    return
                     
-                elif event.type == pg.MOUSEBUTTONUP and self.image == self._images["clicked"]:
-                    if event.button == pg.BUTTON_LEFT:
-                        self._pressed = True
+                elif self.image == self._images["clicked"]:
+                    self._pressed = True
 
             # Ensure that if the mouse button is held down, the state does not just default back to hovering
             if leftMousePressed and self.image == self._images["clicked"]:
@@ -166,11 +231,8 @@ class Button(Input):
             return
         
         # If the button was clicked but then the player moved their mouse off the button, ensure that it stays in the clicked state untill they release the mouse still
-        if self.image == self._images["clicked"]:
-            for event in events:
-                if event.type == pg.MOUSEBUTTONUP:
-                    if event.button == pg.BUTTON_LEFT:
-                        self._pressed = True
+        if self.image == self._images["clicked"] and events.getLeftUp():
+            self._pressed = True
 
         # If either the mouse is depressed or the previous state was not clicked, change the state to idle
         if not (leftMousePressed and self.image == self._images["clicked"]):
@@ -232,7 +294,7 @@ class Switch(Input):
             self._state = 0
 
     # Overwrite the update method
-    def update(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
+    def update(self, events: EventBundle, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
         """Update the _pressed, image and _state attributes based on mouse position, mouse pressed, and the events queue.
 
         Use the events queue, mouse position and mouse pressed parameters to decide whether the button has been pressed,
@@ -240,7 +302,7 @@ class Switch(Input):
         Also, cycle the state for the idle image every time the switch is released from being pressed.
 
         Args:
-            events (list): The current frame's events queue.
+            events (EventBundle): The current frame's classified events.
             mosePos (pg.Vector2): The position of the mouse as a vector.
             leftMousePressed (bool): Whether or not the left mouse button is currently being pressed down.
 
@@ -255,18 +317,16 @@ class Switch(Input):
         # If the mouse is hovering over the switch, its state should either be clicked or hovering
         if self.rect.collidepoint(mousePos):
             # If the mouse is clicked, change and cycle state, and if it is released, assign the pressed attribute to True
-            for event in events:
-
-                if event.type == pg.MOUSEBUTTONDOWN:
-                    if event.button == pg.BUTTON_LEFT:
-                        self.setImage("clicked")
-                        self.cycleState()
-                        self._pressed = True
-                        return
+            for eventType in events.getLeftEvents():
+
+                if eventType == pg.MOUSEBUTTONDOWN:
+                    self.setImage("clicked")
+                    self.cycleState()
+                    self._pressed = True
+                    return
                     
-                elif event.type == pg.MOUSEBUTTONUP and clicked(self.image, self._images["clicked"]):
-                    if event.button == pg.BUTTON_LEFT:
-                        self._released = True
+                elif clicked(self.image, self._images["clicked"]):
+                    self._released = True
 
             # Ensure that if the mouse button is held down, the state does not just default back to hovering
             if leftMousePressed and clicked(self.image, self._images["clicked"]):
@@ -275,12 +335,55 @@ class Switch(Input):
             return
         
         # If the switch was clicked but then the player moved their mouse off the switch, ensure that it stays in the clicked state untill they release the mouse still
-        if clicked(self.image, self._images["clicked"]):
-            for event in events:
-                if event.type == pg.MOUSEBUTTONUP:
-                    if event.button == pg.BUTTON_LEFT:
-                        self._released = True
+        if events.getLeftUp() and clicked(self.image, self._images["clicked"]):
+            self._released = True
                         
         # If either the mouse is depressed or the previous state was not clicked, change the state to idle
         if not (leftMousePressed and clicked(self.image, self._images["clicked"])):
             self.setImage("idle")
+
+
+# Define functions to load the image assets, which are cached since the same images are loaded again on every restart, undo and promotion
+@lru_cache(maxsize=None)
+def loadImage(name: str, size: tuple) -> pg.surface.Surface:
+    """Return an image from the assets folder, converted for alpha and scaled to a size.
+
+    The result is cached by name and size, so it is shared between every caller and must be copied before being drawn onto.
+
+    Args:
+        name (str): The file name of the image within the assets folder.
+        size (tuple): The size in pixels to which the image is scaled.
+
+    Kwargs:
+        None
+
+    Returns:
+        The scaled image.
+    """
+    logger.debug("Asset {} loaded", name)
+    return pg.transform.scale(pg.image.load(os.path.join(ASSETS_DIR, name)).convert_alpha(), size)
+
+@lru_cache(maxsize=None)
+def loadButtonImages(name: str, size: tuple) -> tuple:
+    """Return the idle, hovering and clicked images of a button from the assets folder.
+
+    The hovering image is the idle image darkened once, and the clicked image is it darkened twice.
+    The results are cached by name and size, so they are shared between every caller and must be copied before being drawn onto.
+
+    Args:
+        name (str): The file name of the button image within the assets folder.
+        size (tuple): The size in pixels of the button.
+
+    Kwargs:
+        None
+
+    Returns:
+        A tuple of the idle, hovering and clicked images.
+    """
+    idle = loadImage(name, size)
+    # Darken by multiplying each copy in place with a fill, rather than blitting a separate darkener surface onto it
+    hovering = idle.copy()
+    hovering.fill((100, 100, 100), special_flags=pg.BLEND_MULT)
+    clicked = hovering.copy()
+    clicked.fill((100, 100, 100), special_flags=pg.BLEND_MULT)
+    return idle, hovering, clicked
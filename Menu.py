@@ -15,7 +15,6 @@ Functions:
 
 # Import modules and libraries
 from loguru import logger
-import os
 import pygame as pg
 
 import Input as inp
@@ -62,54 +61,32 @@ class Menu:
         self.__playGame: bool = False
         self.__screenSize: pg.Vector2 = screenSize
         self.__image: pg.surface.Surface = pg.surface.Surface(self.__screenSize)
-        self.__title: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Title.png").convert_alpha(), self.__screenSize.elementwise() / pg.Vector2(4, 10/3))
-        self.__vs: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\VS.png").convert_alpha(), self.__screenSize.elementwise() / pg.Vector2(4, 10/3))
+        self.__title: pg.surface.Surface = inp.loadImage("Title.png", tuple(self.__screenSize.elementwise() / pg.Vector2(4, 10/3)))
+        self.__vs: pg.surface.Surface = inp.loadImage("VS.png", tuple(self.__screenSize.elementwise() / pg.Vector2(4, 10/3)))
         self.__state: bool = False
         self.__mainButtons: pg.sprite.Group = pg.sprite.Group()
         self.__oppButtons: pg.sprite.Group = pg.sprite.Group()
         self.__transOffset: int = 0
         self.__opponent = False
 
-        # Define the variables for changing the surfaces
+        # Define the sizes of the buttons
         mainButtonSize = self.__screenSize.elementwise() / pg.Vector2(2, 5)
         oppButtonSize = mainButtonSize / 1.5
-        buttonDarkener = pg.surface.Surface(mainButtonSize, pg.SRCALPHA)
-        buttonDarkener.fill((100, 100, 100))
 
         # Create the buttons based on previously defined surfaces
-        playGameButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Play Button.png").convert_alpha(), mainButtonSize)
-        playGameButtonHovering = playGameButtonIdle.copy()
-        playGameButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-        playGameButtonClicked = playGameButtonHovering.copy()
-        playGameButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+        playGameButtonIdle, playGameButtonHovering, playGameButtonClicked = inp.loadButtonImages("Play Button.png", tuple(mainButtonSize))
         self.__playGameButton: inp.Button = inp.Button(mainButtonSize, (self.__screenSize.elementwise() / pg.Vector2(4, 2.5)), playGameButtonIdle, playGameButtonHovering, playGameButtonClicked)
         self.__mainButtons.add(self.__playGameButton)
-        exitButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Exit Button.png").convert_alpha(), mainButtonSize)
-        exitButtonHovering = exitButtonIdle.copy()
-        exitButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-        exitButtonClicked = exitButtonHovering.copy()
-        exitButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+        exitButtonIdle, exitButtonHovering, exitButtonClicked = inp.loadButtonImages("Exit Button.png", tuple(mainButtonSize))
         self.__exitButton: inp.Button = inp.Button(mainButtonSize, (self.__screenSize.elementwise() / pg.Vector2(4, 13/9)), exitButtonIdle, exitButtonHovering, exitButtonClicked)
         self.__mainButtons.add(self.__exitButton)
-        humanButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Human Button.png").convert_alpha(), oppButtonSize)
-        humanButtonHovering = humanButtonIdle.copy()
-        humanButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-        humanButtonClicked = humanButtonHovering.copy()
-        humanButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+        humanButtonIdle, humanButtonHovering, humanButtonClicked = inp.loadButtonImages("Human Button.png", tuple(oppButtonSize))
         self.__humanButton: inp.Button = inp.Button(oppButtonSize, (self.__screenSize.elementwise() / pg.Vector2(3, 2.5)), humanButtonIdle, humanButtonHovering, humanButtonClicked)
         self.__oppButtons.add(self.__humanButton)
-        computerButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Computer Button.png").convert_alpha(), oppButtonSize)
-        computerButtonHovering = computerButtonIdle.copy()
-        computerButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-        computerButtonClicked = computerButtonHovering.copy()
-        computerButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+        computerButtonIdle, computerButtonHovering, computerButtonClicked = inp.loadButtonImages("Computer Button.png", tuple(oppButtonSize))
         self.__computerButton: inp.Button = inp.Button(oppButtonSize, (self.__screenSize.elementwise() / pg.Vector2(3, 1.7)), computerButtonIdle, computerButtonHovering, computerButtonClicked)
         self.__oppButtons.add(self.__computerButton)
-        backButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Back Button.png").convert_alpha(), oppButtonSize)
-        backButtonHovering = backButtonIdle.copy()
-        backButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-        backButtonClicked = backButtonHovering.copy()
-        backButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+        backButtonIdle, backButtonHovering, backButtonClicked = inp.loadButtonImages("Back Button.png", tuple(oppButtonSize))
         self.__backButton: inp.Button = inp.Button(oppButtonSize, (self.__screenSize.elementwise() / pg.Vector2(3, 1.3)), backButtonIdle, backButtonHovering, backButtonClicked)
         self.__oppButtons.add(self.__backButton)
 
@@ -146,7 +123,7 @@ class Menu:
         Returns:
             Returns the image of the current frame of the changing animation.
         """
-        logger.debug(f"Menu state transition to {self.__state}")
+        logger.debug("Menu state transition to {}", self.__state)
         # Define the method of change depending on the target state
         if self.__state:
             offset = self.__transOffset
@@ -182,14 +159,14 @@ class Menu:
         self.__exitButton.setPos(self.__screenSize.elementwise() / pg.Vector2(4, 13/9))
         self.__transOffset = 0
 
-    def update(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool) -> pg.surface.Surface:
+    def update(self, events: inp.EventBundle, mousePos: pg.Vector2, leftMousePressed: bool) -> pg.surface.Surface:
         """Draw the main screen, title card, and update and then draw the relevant buttons.
 
         Process the user inputs, update then draw the relevant buttons, executing their functionality if any of them are pressed,
         handle the drawing of the screen image regardless of state and check whether, and if so handle, a state transition animation.
         
         Args:
-            events (list): The event queue of the current cycle.
+            events (inp.EventBundle): The classified events of the current cycle.
             mousePos (pg.Vector2): The current mouse cursor position.
             leftMousePressed (bool): Whether the left mouse button is currently being pressed.
 
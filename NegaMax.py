@@ -8,18 +8,34 @@ Classes:
     NegaMax: The chess bot.
 
 Functions:
-    None
+    zobristHash: Return the Zobrist hash of a virtual board list.
+    updateZobrist: Return a Zobrist hash updated for only the squares which differ between two virtual board lists.
 """
 
 # Import modules and libraries
+from collections import OrderedDict
 from loguru import logger
 import mouse
 import pygame as pg
+import random
 import time
 
 import Board as boa
 
 
+# Define the Zobrist keys, seeded so that they are the same every run, with one key per square and piece integer code (the codes include the moved and double moved states, so castling and en passant rights are keyed too)
+# The squares are always from white's perspective, so that rotating the virtual board does not change the hash
+_ZOBRIST_RANDOM = random.Random(0x5A)
+ZOBRIST_PIECES: tuple = tuple(tuple(_ZOBRIST_RANDOM.getrandbits(64) for code in range(56)) for square in range(64))
+ZOBRIST_TURN: int = _ZOBRIST_RANDOM.getrandbits(64)
+
+# Define the transposition table size and the flags stating whether a stored score is exact, a lower bound or an upper bound
+TABLE_SIZE: int = 2 ** 16
+EXACT: int = 0
+LOWER: int = 1
+UPPER: int = 2
+
+
 # Create the minimax class
 class NegaMax:
     """A chess engine using the negamax evaluation algorithm to identify the optimal moves.
@@ -33,6 +49,7 @@ class NegaMax:
 
     Public Methods:
         stopThinking: Reset attributes and stop processes.
+        reset: Stop any search and reset the time and depth limits for a new game, keeping the transposition table.
         weaponsTight: Mutator method for the __ROE and __maxDepth attributes, which changes the time constraints on when moves can be made to be more time pressured, as well as the evaluation depth.
         weaponsFree: Mutator method for the __ROE and __maxDepth attributes, which changes the time constraints on when moves can be made to be more time pressured, as well as the evaluation depth.
         takeTurn: The main method of this class, which handles all relevant others and calculates the best moves.
@@ -49,6 +66,7 @@ class NegaMax:
         __bestMove (tuple): The current most effective move.
         __ROE (int): The rules of engagement, i.e. the time constraints.
         __maxDepth (int): 1 less than the maximum depth within the recursive part of the takeTurn method.
+        __table (OrderedDict): The transposition table, mapping a Zobrist hash to its score, depth, flag and best move, which is kept between turns.
     """
 
     # The evaluation metrics should remain static, so they are being defined as class attributes
@@ -155,6 +173,7 @@ class NegaMax:
         self.__bestMove: tuple = ()
         self.__ROE: int = 10
         self.__maxDepth: int = 2
+        self.__table: OrderedDict = OrderedDict()
 
     def __startThinking(self, board: boa.VirtualBoard) -> None:
         """Set the thinking time attribute as the current time and the paused attribute to False."""
@@ -163,7 +182,7 @@ class NegaMax:
         self.__moveComplete = False
         self.__moveMade = False
         self.__bestMove = board.getAllLegalMoves()[0]
-        logger.debug(f"Default best move: {self.__bestMove}")
+        logger.debug("Default best move: {}", self.__bestMove)
 
     def stopThinking(self) -> None:
         """Reset all attributes and stop all current processes."""
@@ -172,6 +191,14 @@ class NegaMax:
         self.__moveComplete = True
         self.__moveMade = True
 
+    def reset(self) -> None:
+        """Stop any current search and reset the rules of engagement and depth for a new game, but keep the transposition table since its positions are still valid."""
+        logger.info("NegaMax reset")
+        # The best move is left alone, since the worker thread may still be searching and would read it when the stopped search finishes
+        self.stopThinking()
+        self.__ROE = 10
+        self.__maxDepth = 2
+
     def weaponsTight(self) -> None:
         """Set the rules of engagement attribute to 10 seconds and depth to 2."""
         self.__ROE = 10
@@ -206,21 +233,20 @@ class NegaMax:
         # Run different operations based on the speed required
         if speed:
             # Iterate through every board square
-            for column in board.getBoard():
-                for piece in column:
-                    
-                    # Only bother with the subsequent actions if the square contains a piece
-                    if piece != None:
+            for piece in board.getBoard():
+                
+                # Only bother with the subsequent actions if the square contains a piece
+                if piece != None:
 
-                        # Add score if the piece is friendly, and subtract it if it is not
-                        if piece % 2 == board.getTurn():
-                            if piece < 50:
-                                eval += self.__piecePoints[piece // 10]
-                            else:
-                                eval += 10000
+                    # Add score if the piece is friendly, and subtract it if it is not
+                    if piece % 2 == board.getTurn():
+                        if piece < 50:
+                            eval += self.__piecePoints[piece // 10]
                         else:
-                            if piece < 50:
-                                eval -= self.__piecePoints[piece // 10]
+                            eval += 10000
+                    else:
+                        if piece < 50:
+                            eval -= self.__piecePoints[piece // 10]
 
             # Add an arbitrary 100 to balance against the full evaluation
             eval += self.__possibilityPoints * len(board.getAllLegalMoves()) + self.__perilPoints * (board.getCheck() - board.getCheck(turnOffset=True)) + 100
@@ -229,9 +255,11 @@ class NegaMax:
             bishops = 0
             rooks = 0
             pawnRows = []
-            # Iterate through every board square
-            for x, column in enumerate(board.getBoard()):
-                for y, piece in enumerate(column):
+            # Iterate through every board square, column by column so that the pawn rows list is in order
+            boardList = board.getBoard()
+            for x in range(8):
+                for y in range(8):
+                    piece = boardList[y * 8 + x]
 
                     # Only bother with the subsequent actions if the square contains a piece
                     if piece != None:
@@ -290,16 +318,16 @@ class NegaMax:
             # Add the extras
             eval += self.__possibilityPoints * len(board.getAllLegalMoves()) + self.__perilPoints * (board.getCheck() - board.getCheck(turnOffset=True))
 
-        logger.debug(f"Board evaluation: {eval}")
+        logger.debug("Board evaluation: {}", eval)
         return eval
 
     def __makeAMove(self, boardPos: pg.Vector2, squareSize: pg.Vector2, promotion: bool) -> None:
         """Use the mouse library to control the mouse and make the move for black when ready."""
-        logger.info(f"Move made at {time.perf_counter()}")
+        logger.info("Move made at {}", time.perf_counter())
         # Only run this if the move has not already been made
         if not self.__moveMade:
             # Find the centre of the starting square and the ending square
-            centrePos = lambda square: boardPos + ((square.elementwise() + 0.5) * squareSize.x)
+            centrePos = lambda square: boardPos + ((pg.Vector2(square % 8, square // 8).elementwise() + 0.5) * squareSize.x)
             start = centrePos(self.__bestMove[0])
             end = centrePos(self.__bestMove[1])
 
@@ -353,14 +381,14 @@ class NegaMax:
             None: []
         }
         for move in moves:
-            if board[int(move[1].x)][int(move[1].y)] == None:
+            if board[move[1]] == None:
                 # Account for en passant taking a pawn but not looking like it does
                 if len(move) == 3 and move[2] == "e":
                     taken[0].append(move)
                 else:
                     taken[None].append(move)
             else:
-                taken[board[int(move[1].x)][int(move[1].y)] // 10].append(move)
+                taken[board[move[1]] // 10].append(move)
 
         final = []
         # If the move is a special move, it will more often than not produce a better-than-average result
@@ -374,7 +402,7 @@ class NegaMax:
                     regular.append(move)
 
             # Get the distance between the move's file and the centre of the board, and use this to roughly sort the rest, since typically moves closer to the centre produce better results
-            prox = lambda move: abs(((move[0].x + move[1].x) / 2) - 3.5)
+            prox = lambda move: abs((((move[0] % 8) + (move[1] % 8)) / 2) - 3.5)
             special.sort(key=prox)
             regular.sort(key=prox)
 
@@ -383,7 +411,7 @@ class NegaMax:
             final += regular
         return final
 
-    def takeTurn(self, boardPos: pg.Vector2, squareSize: pg.Vector2, board: boa.VirtualBoard, depth: None | int=None, alpha: int=-10000, beta: int=10000) -> None:
+    def takeTurn(self, boardPos: pg.Vector2, squareSize: pg.Vector2, board: boa.VirtualBoard, depth: None | int=None, alpha: int=-10000, beta: int=10000, zobrist: None | int=None) -> None:
         """Generate and evaluate all possible moves to get the best one, while routinely checking the process against the time limit.
         
         Run checks depending on the depth, as well as checking against the time limit to decide whether a move needs to be forced,
@@ -399,6 +427,7 @@ class NegaMax:
             depth (None | int) = None: The current layer/recursion depth that this function has been called at.
             alpha (int): The maximum pointer - the minimum possible score black (the computer) is guaranteed to get currently.
             beta (int): The minimum pointer - the maximum possible score white (the player) is guaranteed to get currently.
+            zobrist (None | int) = None: The Zobrist hash of the board, which is calculated from scratch if not passed.
 
         Returns:
             None
@@ -406,21 +435,33 @@ class NegaMax:
         # If depth was not passed, set it to the maximum depth
         if depth == None:
             depth = self.__maxDepth
-        logger.debug(f"The depth is {depth} and the current board is {board.getBoard()}")
+        # If the hash was not passed, calculate it
+        if zobrist == None:
+            zobrist = zobristHash(board.getBoard(), board.getTurn())
+        logger.opt(lazy=True).debug("The depth is {} and the current board is {}", lambda: depth, board.getBoard)
 
         # If this is the first call, start the thinking time
         if depth == self.__maxDepth:
             self.__startThinking(board)
 
+            # If this position has already been searched exactly to at least this depth, as happens after an undo, make its stored best move without searching again
+            entry = self.__table.get(zobrist)
+            if entry != None and entry[1] >= depth and entry[2] == EXACT and entry[3] in board.getAllLegalMoves():
+                logger.info("Move found in the transposition table")
+                self.__bestMove = entry[3]
+                self.__finishTurn(boardPos, squareSize, board)
+                return
+
         # Check the thinking time against the time limit
         if time.perf_counter() - self.__thinkingTime >= self.__ROE:
-            # Forcibly make the move with the best current move
-            # If there is a pawn at the move's starting positiona dn the ending position is at y = 0, promote should be True
-            if board.getBoard()[int(self.__bestMove[0].x)][int(self.__bestMove[0].y)] < 10 and self.__bestMove[1].y == 0:
-                promote = True
-            else:
-                promote = False
-            self.__makeAMove(boardPos, squareSize, promote)
+            # Forcibly make the move with the best current move, if there is one
+            if self.__bestMove:
+                # If there is a pawn at the move's starting positiona dn the ending position is at y = 0, promote should be True
+                if board.getBoard()[self.__bestMove[0]] < 10 and self.__bestMove[1] // 8 == 0:
+                    promote = True
+                else:
+                    promote = False
+                self.__makeAMove(boardPos, squareSize, promote)
             self.stopThinking()
 
         # If this is the final call, simply return the position evaluation
@@ -434,20 +475,37 @@ class NegaMax:
         
         # Move making and recursive logic
         if not self.__moveComplete:
+            # Below the outermost layer, use the transposition table entry for this position if it was searched at least as deeply
+            originalAlpha = alpha
+            if depth != self.__maxDepth and zobrist in self.__table:
+                score, entryDepth, flag = self.__table[zobrist][:3]
+                if entryDepth >= depth:
+                    if flag == EXACT:
+                        return score
+                    elif flag == LOWER:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
+                    if alpha >= beta:
+                        return score
+
             maxScore = -10000
+            bestMove = ()
 
             # Iterate through every possible move and generate a new board of it with which to call negamax again
-            for move in self.__orderMoves(board.getBoard(), board.getAllLegalMoves()):
-                logger.debug(f"The depth is {depth} and the current move is {move}")
+            boardList = board.getBoard()
+            for move in self.__orderMoves(boardList, board.getAllLegalMoves()):
+                logger.debug("The depth is {} and the current move is {}", depth, move)
                 newBoard = boa.VirtualBoard(board.getTurn())
-                newBoard.setBoard(board.getBoard())
+                newBoard.setBoard(boardList)
                 newBoard.makeMove(move)
-                score = - self.takeTurn(boardPos, squareSize, newBoard, depth - 1, -beta, -alpha)
+                score = - self.takeTurn(boardPos, squareSize, newBoard, depth - 1, -beta, -alpha, updateZobrist(zobrist, boardList, board.getTurn(), newBoard.getBoard()))
 
                 # If the current score is higher than the maximum, change the maximum and if it is the first move, change the first move
-                logger.debug(f"Score: {score}, maxScore: {maxScore}")
+                logger.debug("Score: {}, maxScore: {}", score, maxScore)
                 if score > maxScore:
                     maxScore = score
+                    bestMove = move
                     if depth == self.__maxDepth:
                         self.__bestMove = move
 
@@ -456,20 +514,90 @@ class NegaMax:
                 if alpha >= beta:
                     break
 
+            # Store the score and best move, unless the search was cut short by the time limit, in which case they cannot be trusted
+            if not self.__moveComplete:
+                if maxScore <= originalAlpha:
+                    flag = UPPER
+                elif maxScore >= beta:
+                    flag = LOWER
+                else:
+                    flag = EXACT
+                self.__table[zobrist] = (maxScore, depth, flag, bestMove)
+                self.__table.move_to_end(zobrist)
+                # Evict the least recently stored entry once the table is full
+                if len(self.__table) > TABLE_SIZE:
+                    self.__table.popitem(last=False)
+
             if depth != self.__maxDepth:
                 return maxScore
         else:
             return -10000
 
-        logger.info(f"Move found at {time.perf_counter()}")
+        self.__finishTurn(boardPos, squareSize, board)
+
+    def __finishTurn(self, boardPos: pg.Vector2, squareSize: pg.Vector2, board: boa.VirtualBoard) -> None:
+        """Make the best move once it has been found, waiting until the 3 second time limit has been reached, and stop thinking."""
+        logger.info("Move found at {}", time.perf_counter())
 
-        # If this is the outermost layer, stop thinking and make the move as long as the 3 second time limit has been reached
         # Give a delay if processing for the frame finished early
         time.sleep(max(3 + self.__thinkingTime - time.perf_counter(), 0))
-        # If there is a pawn at the move's starting positiona dn the ending position is at y = 0, promote should be True
-        if board.getBoard()[int(self.__bestMove[0].x)][int(self.__bestMove[0].y)] < 10 and self.__bestMove[1].y == 0:
-            promote = True
-        else:
-            promote = False
-        self.__makeAMove(boardPos, squareSize, promote)
+        if self.__bestMove:
+            # If there is a pawn at the move's starting positiona dn the ending position is at y = 0, promote should be True
+            if board.getBoard()[self.__bestMove[0]] < 10 and self.__bestMove[1] // 8 == 0:
+                promote = True
+            else:
+                promote = False
+            self.__makeAMove(boardPos, squareSize, promote)
         self.stopThinking()
+
+
+# Define a function to hash a virtual board list
+def zobristHash(board: list, turn: bool) -> int:
+    """Return the Zobrist hash of a virtual board list whose turn it is, with every square seen from white's perspective."""
+    # If it is black's turn, the board list is rotated, so reverse it back
+    if turn:
+        board = board[::-1]
+    hashValue = ZOBRIST_TURN if turn else 0
+    for square, piece in enumerate(board):
+        if piece != None:
+            hashValue ^= ZOBRIST_PIECES[square][piece]
+    return hashValue
+
+
+# Define a function to update a hash from one board list to the next
+def updateZobrist(hashValue: int, oldBoard: list, oldTurn: bool, newBoard: list, newTurn: None | bool=None) -> int:
+    """Return a Zobrist hash updated from an old virtual board list to a new one.
+
+    Only the keys of the squares whose pieces differ between the two boards are XORed out and in,
+    which is much cheaper than hashing the new board from scratch.
+
+    Args:
+        hashValue (int): The Zobrist hash of the old board.
+        oldBoard (list): The old virtual board list.
+        oldTurn (bool): The turn of the old board.
+        newBoard (list): The new virtual board list.
+
+    Kwargs:
+        newTurn (None | bool) = None: The turn of the new board, which is the opposite of the old turn if not passed, as after a move.
+
+    Returns:
+        The Zobrist hash of the new board.
+    """
+    if newTurn == None:
+        newTurn = not oldTurn
+    # Reverse the rotated board lists back to white's perspective
+    if oldTurn:
+        oldBoard = oldBoard[::-1]
+    if newTurn:
+        newBoard = newBoard[::-1]
+    if oldTurn != newTurn:
+        hashValue ^= ZOBRIST_TURN
+    for square in range(64):
+        old = oldBoard[square]
+        new = newBoard[square]
+        if old != new:
+            if old != None:
+                hashValue ^= ZOBRIST_PIECES[square][old]
+            if new != None:
+                hashValue ^= ZOBRIST_PIECES[square][new]
+    return hashValue
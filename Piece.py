@@ -11,26 +11,99 @@ Classes:
     Bishop: The chess bishop, whose value is 3.
     Knight: The chess knight, whose value is 2.
     Rook: The chess rook, which additionally stores the _movedEver attributes, and whose value is 1.
-    Pawn: The chess pawn, which additionally stores the _movedEver and _doubleMoved attributes, and whose value is 0.
+    Pawn: The chess pawn, which additionally stores the _movedEver attribute, and whose value is 0.
 
 Functions:
-    onBoard: Return whether or not a square, given in vector form, is on the board or not.
-    infDist: Return a list of all possible moves based on an unlimited distance move.
+    decodeMoves: Return the (dx, dy, slide) directions of a list of moves.
+    onBoard: Return whether or not a square, given as a bitboard index, is on the board or not.
+    squareIndex: Return the bitboard index of a square given in vector form.
+    iterBits: Yield the index of every set bit in a bitboard.
+    rotateBitboard: Return a bitboard rotated by 180 degrees.
+    buildLines: Return the tables of line types and between bitboards for every pair of squares.
+    buildRays: Return the tables of rays from every square in each direction, as bitboards and as ordered squares.
+    buildStepTables: Return the tables of knight and king attacks from every square.
+    buildStepMasks: Return the bitboards of the squares from which each single step stays on the board.
+    buildCastleMasks: Return the bitboards of the squares which must be empty for each castle.
+    infDist: Append all possible moves along a single unlimited distance direction to a list of moves.
     updateRegularMoves: Return a list of all possible moves which can be made by any non-pawn pieces.
+    threatenKings: Set any king which can be captured to be threatened.
+    slidingBitboard: Return the bitboard of squares attacked by a sliding piece.
+    updateBitboardMoves: Return the bitboard of all possible moves which can be made by any non-pawn piece.
     updateCastle: Return a list containing the possible castle moves (if any)
-    freeCheck: Return whether or not an input list of board squares are all free.
+    freeCheck: Return whether or not all squares of a bitboard mask are free.
     updatePawnMoves: Return a list containing all possible moves which can be made by a pawn.
+    updateSidePawns: Return the bitboard and special move flags of the regular, double and taking moves of every pawn on a team.
+    generateAllMoves: Return all possible moves of one team on a board of integer pieces, from a cache if the position has been seen before.
+    kingAttacked: Return whether a team attacks the opposing king on a board of integer pieces.
+    encodeBoard: Return a flat copy of a board list with every piece encoded as an integer.
+    buildPawnTables: Return the table of pawn attacks from every square.
     decodeInt: Decode an integer representation of a piece back into, and then return, a copy of the original piece.
 """
 
 # Import modules and libraries
+from collections import OrderedDict
+from functools import lru_cache
 from loguru import logger
-import os
 import pygame as pg
 
 import Input as inp
 
 
+# The name of each team, indexed by team, so that log messages do not need to build a list every time
+TEAM_NAMES: tuple = ("White", "Black")
+
+# The eight directions a piece can slide in, the change in bitboard index of one step in each, and which of them each sliding piece uses, keyed by value
+DIRECTIONS: list = [(x, y) for x in [-1, 0, 1] for y in [-1, 0, 1] if (x, y) != (0, 0)]
+DIRECTION_STEPS: list = [y * 8 + x for x, y in DIRECTIONS]
+SLIDE_DIRECTIONS: dict = {
+    4: list(range(8)),
+    3: [direction for direction, (x, y) in enumerate(DIRECTIONS) if x and y],
+    1: [direction for direction, (x, y) in enumerate(DIRECTIONS) if not (x and y)]
+}
+
+# The moves of each piece should remain static, so they are defined once here, keyed by value
+# Where x means any non-zero number in that direction and mx means its negative
+PIECE_MOVES: dict = {
+    5: [(x, y) for x in [-1, 0, 1] for y in [-1, 0, 1] if (x, y) != (0, 0)],
+    4: [("x", "x"), ("mx", "x"), (0, "x"), ("x", 0)],
+    3: [("x", "x"), ("mx", "x")],
+    2: [(x + z, y) if x == 0 else (x, y + z) for x in [-2, 0, 2] for y in [-2, 0, 2] if (x + y == 2 or x + y == -2) for z in [-1, 1]],
+    1: [("x", 0), (0, "x")]
+}
+
+def decodeMoves(moves: list) -> tuple:
+    """Decode a list of moves into a tuple of (dx, dy, slide) directions.
+
+    Each move with an x in it slides any distance, so it becomes a slide along its positive direction followed by one along its negative direction,
+    where an x component is a step of 1 and an mx component is a step of -1. Every other move is a single step.
+
+    Args:
+        moves (list): The list of moves in the encoding of the PIECE_MOVES dictionary.
+
+    Kwargs:
+        None
+
+    Returns:
+        The tuple of directions, in the same order as the moves.
+    """
+    directions = []
+    for move in moves:
+        if "x" in move or "mx" in move:
+            stepX, stepY = [1 if part == "x" else -1 if part == "mx" else part for part in move]
+            directions += [(stepX, stepY, True), (-stepX, -stepY, True)]
+        else:
+            directions.append((move[0], move[1], False))
+    return tuple(directions)
+
+# The strings are decoded only once, so that move generation works purely with numbers
+PIECE_DIRECTIONS: dict = {value: decodeMoves(moves) for value, moves in PIECE_MOVES.items()}
+
+# The same positions recur constantly through undos and repeated moves, so the move lists generated for each are kept in a cache
+# This maps each piece code, square, turn and position to its move bitboard and flags, evicting the least recently used entry when full
+_MOVE_CACHE: OrderedDict = OrderedDict()
+_MOVE_CACHE_SIZE: int = 1 << 16
+
+
 # Create the piece abstract class
 class Piece(inp.Switch):
     """The abstract base class which dictates the overall behaviour of all piece classes.
@@ -39,7 +112,7 @@ class Piece(inp.Switch):
     and containing other useful shared methods such as encoding, updating and moving the pieces.
     
     Constructor:
-        __init__(size (pg.Vector2), square (pg.Vector2), idle (pg.surface.Surface), team (bool)): Initialise self and attributes.
+        __init__(size (pg.Vector2), square (pg.Vector2), team (bool)): Initialise self and attributes.
 
     Public Methods:
         getTeam: Accessor method for the _team attribute.
@@ -48,12 +121,18 @@ class Piece(inp.Switch):
         getSquare: Accessor method for the _square attribute.
         getMovedEver: Accessor method for the _movedEver attribute.
         movedEverTrue: Mutator method for the _movedEver attribute to set it to True.
-        getLegalMoves: Accessor method for the _legalMoves attribute.
-        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions.
-        removeLegalMove: Mutator method for the _legalMoves attribute to remove any moves which have the same destination as the parameter.
+        getLegalMoves: Accessor method for the _legalMoves attribute to decode it into a list of moves.
+        getMoveBitboard: Accessor method for the _legalMoves attribute.
+        getMoveFlags: Accessor method for the _legalMoveFlags attribute.
+        setLegalMoves: Mutator method for the _legalMoves and _legalMoveFlags attributes.
+        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions, or from the move cache.
+        removeLegalMove: Mutator method for the _legalMoves and _legalMoveFlags attributes to remove any move which has the same destination as the parameter.
         move: Set the _square and _pos attributes to reflect a piece movement.
         update: Call the Switch update method if it is this piece's turn.
         encodeInt: Encode and return the piece as an integer.
+        saveState: Return the square and moved ever attribute of the piece.
+        restoreState: Return the piece to a saved state.
+        batchRender: Draw many pieces onto a surface with a single blit call.
 
     Attributes:
         _size (pg.Vector2): The size of the button - the shape will be a rect based on this.
@@ -66,12 +145,21 @@ class Piece(inp.Switch):
         _squareSize (pg.Vector2): The size of each board square, and thus the piece as well.
         _team (bool): False for white team and True for black team.
         _square (pg.Vector2): The board square (i.e. index of the board array) which this piece inhabits.
-        _legalMoves (list): A list of all legal moves this piece can make.
+        _legalMoves (int): A bitboard of the destination squares of all legal moves this piece can make.
+        _legalMoveFlags (dict): The special move flag of any destination square in _legalMoves which is reached by a special move.
+        _extraAttributes (tuple): The names of any extra boolean attributes of the piece type, which start as False.
+        _directions (tuple): The (dx, dy, slide) directions which the piece type moves in, which is empty for the pawn.
     """
 
+    # Define the class attributes which the piece subclasses overwrite, with no extra state or directions by default
+    _extraAttributes: tuple = ()
+    _directions: tuple = ()
+
     # Initialise an object of this class when called
-    def __init__(self, size: pg.Vector2, square: pg.Vector2, idle: pg.surface.Surface, team: bool) -> None:
-        logger.info(f"{type(self)} created")
+    def __init__(self, size: pg.Vector2, square: pg.Vector2, team: bool) -> None:
+        logger.info("{} created", type(self))
+        # Load the image of this piece type for the team
+        idle = inp.loadImage(self._assetNames[team], tuple(size))
         # Define the image filters depending on the team
         midGrey = pg.surface.Surface(size, pg.SRCALPHA)
         midGrey.fill((50, 50, 50))
@@ -111,12 +199,16 @@ class Piece(inp.Switch):
         hovering = [hovering, hoveringSelected]
         clicked = [clicked, clickedSelected]
 
-        super().__init__(size, square.elementwise() * size, idle, hovering, clicked)
+        super().__init__(size, pg.Vector2(square.x * size.x, square.y * size.y), idle, hovering, clicked)
         # Define the attributes
         self._squareSize: pg.Vector2 = size
         self._team: bool = team
         self._square: pg.Vector2 = square
-        self._legalMoves: list = []
+        self._legalMoves: int = 0
+        self._legalMoveFlags: dict = {}
+        # Define any extra state of this piece type, such as the moved ever attribute for castling and double moves
+        for attribute in self._extraAttributes:
+            setattr(self, attribute, False)
 
     def getTeam(self) -> bool:
         """Return the _team attribute."""
@@ -152,38 +244,126 @@ class Piece(inp.Switch):
             return
     
     def getLegalMoves(self) -> list:
+        """Return the _legalMoves attribute decoded into a list of moves, where special moves have their flag appended to the destination."""
+        moves = []
+        for index in iterBits(self._legalMoves):
+            flag = self._legalMoveFlags.get(index)
+            if flag == None:
+                moves.append((pg.Vector2(index % 8, index // 8), self))
+            else:
+                moves.append(((index % 8, index // 8, flag), self))
+        return moves
+
+    def getMoveBitboard(self) -> int:
         """Return the _legalMoves attribute."""
         return self._legalMoves
-    
-    def updateLegalMoves(self, moveList: list, board: list, turn: bool) -> None:
-        """Update the _legalmoves attribute by calling static functions based on the piece type."""
-        self._legalMoves = updateRegularMoves(self._team, self._square, self, moveList[self._value], board)
+
+    def getMoveFlags(self) -> dict:
+        """Return the _legalMoveFlags attribute."""
+        return self._legalMoveFlags
+
+    def setLegalMoves(self, newMoves: int, newFlags: None | dict=None) -> None:
+        """Set the _legalMoves attribute to a new bitboard and the _legalMoveFlags attribute to a copy of its flags."""
+        self._legalMoves = newMoves
+        self._legalMoveFlags = {} if newFlags == None else newFlags.copy()
+
+    def _encodeMoves(self, moves: list, board: list) -> None:
+        """Set the _legalMoves and _legalMoveFlags attributes to a list of moves returned by the module functions."""
+        self._legalMoves = 0
+        self._legalMoveFlags = {}
+        self._addMoves(moves, board)
+
+    def _addMoves(self, moves: list, board: list) -> None:
+        """Add a list of moves returned by the module functions to the _legalMoves and _legalMoveFlags attributes, threatening any king they capture."""
+        # Each move holds the source index, the destination index, and then the flag if it is a special move
+        for move in moves:
+            self._legalMoves |= 1 << move[1]
+            if len(move) == 3:
+                self._legalMoveFlags[move[1]] = move[2]
+        # The module functions only see integer pieces, so set any threatened king here, where the real pieces are known
+        threatenKings(self._legalMoves, board)
+
+    def _loadCachedMoves(self, board: list, turn: bool, position: None | tuple) -> bool:
+        """Set the _legalMoves attribute from the move cache if this position has been seen before, and return whether it was."""
+        if position == None:
+            return False
+        key = (self.encodeInt(), squareIndex(self._square), turn, getattr(self, "_threatened", False), position)
+        cached = _MOVE_CACHE.get(key)
+        if cached == None:
+            return False
+        _MOVE_CACHE.move_to_end(key)
+        self.setLegalMoves(*cached)
+
+        # Reapply any threat to the opposing king, since this would have been done when the moves were generated
+        for index in iterBits(self._legalMoves):
+            target = board[index % 8][index // 8]
+            if isinstance(target, King) and target.getTeam() != self._team:
+                target.threatenedTrue()
+        return True
+
+    def _storeCachedMoves(self, turn: bool, position: None | tuple) -> None:
+        """Store the _legalMoves and _legalMoveFlags attributes in the move cache, evicting the oldest entry if it is full."""
+        if position != None:
+            _MOVE_CACHE[(self.encodeInt(), squareIndex(self._square), turn, getattr(self, "_threatened", False), position)] = (self._legalMoves, self._legalMoveFlags.copy())
+            if len(_MOVE_CACHE) > _MOVE_CACHE_SIZE:
+                _MOVE_CACHE.popitem(last=False)
+
+    def updateLegalMoves(self, board: list, turn: bool, position: None | tuple=None, occupancy: None | tuple=None, pawnMoves: None | dict=None) -> None:
+        """Update the _legalmoves attribute by calling static functions based on the piece type, or from the move cache if the position is known."""
+        if not self._loadCachedMoves(board, turn, position):
+            if occupancy == None:
+                self._encodeMoves(updateRegularMoves(self._team, squareIndex(self._square), self.encodeInt(), self._directions, encodeBoard(board)), board)
+            else:
+                self.setLegalMoves(updateBitboardMoves(self._team, squareIndex(self._square), self, board, occupancy))
+            self._storeCachedMoves(turn, position)
 
     def removeLegalMove(self, square: pg.Vector2) -> None:
-        """Remove a move from the _legalmoves attribute if its destination matches the square passed as a parameter."""
-        for i, move in enumerate(self._legalMoves):
-            if move[0][0] == square.x and move[0][1] == square.y:
-                del(self._legalMoves[i])
+        """Remove a move from the _legalMoves and _legalMoveFlags attributes if its destination matches the square passed as a parameter."""
+        index = squareIndex(square)
+        self._legalMoves &= ~(1 << index)
+        self._legalMoveFlags.pop(index, None)
     
     def move(self, newSquare: pg.Vector2) -> None:
         """Set the _square and _pos attributes to new values."""
         self._square = newSquare
-        super().setPos(newSquare.elementwise() * self._squareSize)
+        super().setPos(pg.Vector2(newSquare.x * self._squareSize.x, newSquare.y * self._squareSize.y))
 
-    def update(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool, turn: bool) -> None:
+    def update(self, events: inp.EventBundle, mousePos: pg.Vector2, leftMousePressed: bool, turn: bool) -> None:
         """Call the Switch update method if it is this piece's turn."""
         if self._team == turn:
             super().update(events, mousePos, leftMousePressed)
 
+    def saveState(self) -> tuple:
+        """Return the x and y of the _square attribute and the _movedEver attribute, which is False for any piece which has never set one, as a tuple."""
+        return int(self._square.x), int(self._square.y), getattr(self, "_movedEver", False)
+
+    def restoreState(self, state: tuple) -> None:
+        """Move the piece back to the square of a saved state, restore its moved ever attribute, and reset it to unselected as if it had just been created."""
+        self.move(pg.Vector2(state[0], state[1]))
+        self._movedEver = state[2]
+        self.baseImage()
+        self.pressedFalse()
+
+    @staticmethod
+    def batchRender(dest: pg.surface.Surface, pieces) -> None:
+        """Draw every piece onto the destination surface in one call rather than blitting each separately."""
+        sequence = [(piece.image, piece.rect) for piece in pieces]
+        # The fblits method only exists in some versions of pygame, so fall back to blits without returning the changed rects
+        if hasattr(dest, "fblits"):
+            dest.fblits(sequence)
+        else:
+            dest.blits(sequence, False)
+
     def encodeInt(self) -> int:
         """Encode the piece state into an integer.
         
         Encodes all data needed to replicate the piece into an integer, which is effectively
         a compressed method of storing the piece without all of the unnecessary attributes such as image.
         In order from the least to most significant digit, the code is determined as follows:
-        - Digit 1 is a combination of the team, moved ever (if it exists) and double moved (also if it exists)
+        - Digit 1 is a combination of the team, moved ever (if it exists) and double moved
             Team 0 is white and 1 is black, and the three are stored using digits 0-7 as 3 bit binary,
             with most to least significant being: double moved, moved ever, team
+            Double moved is held by the board rather than the pawn, so it is never set here
         - Digit 2 is the piece value
             0-5 in order mean: pawn, rook, knight, bishop, queen, king
         
@@ -197,12 +377,10 @@ class Piece(inp.Switch):
             Returns the integer which was created to store the piece data.
         """
         code = (self._value * 10) + self._team
-        # Use a try-except clause since not all pieces have the moved ever and double moved attributes
+        # Use a try-except clause since not all pieces have the moved ever attribute
         try:
             if self._movedEver:
                 code += 2
-                if self._doubleMoved:
-                    code += 4
         except AttributeError:
             pass
         return code
@@ -225,12 +403,18 @@ class King(Piece):
         getSquare: Accessor method for the _square attribute.
         getMovedEver: Accessor method for the _movedEver attribute.
         movedEverTrue: Mutator method for the _movedEver attribute to set it to True.
-        getLegalMoves: Accessor method for the _legalMoves attribute.
+        getLegalMoves: Accessor method for the _legalMoves attribute to decode it into a list of moves.
+        getMoveBitboard: Accessor method for the _legalMoves attribute.
+        getMoveFlags: Accessor method for the _legalMoveFlags attribute.
+        setLegalMoves: Mutator method for the _legalMoves and _legalMoveFlags attributes.
         updateLegalMoves: Overwritten from the Piece class to include checking for castle.
-        removeLegalMove: Mutator method for the _legalMoves attribute to remove any moves which have the same destination as the parameter.
+        removeLegalMove: Mutator method for the _legalMoves and _legalMoveFlags attributes to remove any move which has the same destination as the parameter.
         move: Set the _square and _pos attributes to reflect a piece movement.
         update: Call the Switch update method if it is this piece's turn.
         encodeInt: Encode and return the piece as an integer.
+        saveState: Return the square and moved ever attribute of the piece.
+        restoreState: Return the piece to a saved state.
+        batchRender: Draw many pieces onto a surface with a single blit call.
         getThreatened: Accessor method for the _threatened attribute.
         threatenedTrue: Mutator method for the _threatened attribute to set it to True.
         threatenedFalse: Mutator method for the _threatened attribute to set it to False.
@@ -246,21 +430,21 @@ class King(Piece):
         _squareSize (pg.Vector2): The size of each board square, and thus the piece as well.
         _team (bool): False for white team and True for black team.
         _square (pg.Vector2): The board square (i.e. index of the board array) which this piece inhabits.
-        _legalMoves (list): A list of all legal moves this piece can make.
+        _legalMoves (int): A bitboard of the destination squares of all legal moves this piece can make.
+        _legalMoveFlags (dict): The special move flag of any destination square in _legalMoves which is reached by a special move.
         _value (int): The piece type's arbitrary integer value.
+        _assetNames (tuple): The file names of the white and black images of the piece type.
+        _extraAttributes (tuple): The names of any extra boolean attributes of the piece type, which start as False.
+        _directions (tuple): The (dx, dy, slide) directions which the piece type moves in, which is empty for the pawn.
         _movedEver (bool): Whether this piece has ever moved.
         _threatened (bool): Whether this piece is currently under attack from a piece on the opposing team.
     """
 
-    # Initialise an object of this class when called
-    def __init__(self, size: pg.Vector2, square: pg.Vector2, team: bool) -> None:
-        # Define attributes
-        self._value: int = 5
-        super().__init__(size, square, pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + ["\\Assets\\White King.png", "\\Assets\\Black King.png"][team]).convert_alpha(), size), team)
-        # Define the moved ever attribute to allow for castling
-        self._movedEver: bool = False
-        # Define the threatened attribute to allow for check checking
-        self._threatened: bool = False
+    # Define the class attributes read by the Piece constructor
+    _value: int = 5
+    _assetNames: tuple = ("White King.png", "Black King.png")
+    _directions: tuple = PIECE_DIRECTIONS[5]
+    _extraAttributes: tuple = ("_movedEver", "_threatened")
 
     def getThreatened(self) -> bool:
         """Return the threatened attribute."""
@@ -274,12 +458,22 @@ class King(Piece):
         """Set the threatened attribute to False."""
         self._threatened = False
 
-    def updateLegalMoves(self, moveList: list, board: list, turn: bool) -> None:
+    def restoreState(self, state: tuple) -> None:
+        """Overwrite the restore state method to also reset the threatened attribute."""
+        super().restoreState(state)
+        self._threatened = False
+
+    def updateLegalMoves(self, board: list, turn: bool, position: None | tuple=None, occupancy: None | tuple=None, pawnMoves: None | dict=None) -> None:
         """Overwrite the update legal moves method to include checking whether castling is legal."""
-        self._legalMoves = updateRegularMoves(self._team, self._square, self, moveList[self._value], board)
-        if not (self._movedEver or self._threatened):
-            # Find whether the piece is active by checking the turn against the team
-            self._legalMoves += updateCastle(self._team == turn, turn, self, board)
+        if not self._loadCachedMoves(board, turn, position):
+            if occupancy == None:
+                self._encodeMoves(updateRegularMoves(self._team, squareIndex(self._square), self.encodeInt(), self._directions, encodeBoard(board)), board)
+            else:
+                self.setLegalMoves(updateBitboardMoves(self._team, squareIndex(self._square), self, board, occupancy))
+            if not (self._movedEver or self._threatened):
+                # Find whether the piece is active by checking the turn against the team
+                self._addMoves(updateCastle(self._team == turn, turn, self.encodeInt(), encodeBoard(board), None if occupancy == None else occupancy[0] | occupancy[1]), board)
+            self._storeCachedMoves(turn, position)
 
 
 # Create the queen class
@@ -298,12 +492,18 @@ class Queen(Piece):
         getSquare: Accessor method for the _square attribute.
         getMovedEver: Accessor method for the _movedEver attribute.
         movedEverTrue: Mutator method for the _movedEver attribute to set it to True.
-        getLegalMoves: Accessor method for the _legalMoves attribute.
-        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions.
-        removeLegalMove: Mutator method for the _legalMoves attribute to remove any moves which have the same destination as the parameter.
+        getLegalMoves: Accessor method for the _legalMoves attribute to decode it into a list of moves.
+        getMoveBitboard: Accessor method for the _legalMoves attribute.
+        getMoveFlags: Accessor method for the _legalMoveFlags attribute.
+        setLegalMoves: Mutator method for the _legalMoves and _legalMoveFlags attributes.
+        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions, or from the move cache.
+        removeLegalMove: Mutator method for the _legalMoves and _legalMoveFlags attributes to remove any move which has the same destination as the parameter.
         move: Set the _square and _pos attributes to reflect a piece movement.
         update: Call the Switch update method if it is this piece's turn.
         encodeInt: Encode and return the piece as an integer.
+        saveState: Return the square and moved ever attribute of the piece.
+        restoreState: Return the piece to a saved state.
+        batchRender: Draw many pieces onto a surface with a single blit call.
 
     Attributes:
         _size (pg.Vector2): The size of the button - the shape will be a rect based on this.
@@ -316,15 +516,18 @@ class Queen(Piece):
         _squareSize (pg.Vector2): The size of each board square, and thus the piece as well.
         _team (bool): False for white team and True for black team.
         _square (pg.Vector2): The board square (i.e. index of the board array) which this piece inhabits.
-        _legalMoves (list): A list of all legal moves this piece can make.
+        _legalMoves (int): A bitboard of the destination squares of all legal moves this piece can make.
+        _legalMoveFlags (dict): The special move flag of any destination square in _legalMoves which is reached by a special move.
         _value (int): The piece type's arbitrary integer value.
+        _assetNames (tuple): The file names of the white and black images of the piece type.
+        _extraAttributes (tuple): The names of any extra boolean attributes of the piece type, which start as False.
+        _directions (tuple): The (dx, dy, slide) directions which the piece type moves in, which is empty for the pawn.
     """
 
-    # Initialise an object of this class when called
-    def __init__(self, size: pg.Vector2, square: pg.Vector2, team: bool) -> None:
-        # Define attributes
-        self._value: int = 4
-        super().__init__(size, square, pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + ["\\Assets\\White Queen.png", "\\Assets\\Black Queen.png"][team]).convert_alpha(), size), team)
+    # Define the class attributes read by the Piece constructor
+    _value: int = 4
+    _assetNames: tuple = ("White Queen.png", "Black Queen.png")
+    _directions: tuple = PIECE_DIRECTIONS[4]
 
 
 # Create the bishop class
@@ -343,12 +546,18 @@ class Bishop(Piece):
         getSquare: Accessor method for the _square attribute.
         getMovedEver: Accessor method for the _movedEver attribute.
         movedEverTrue: Mutator method for the _movedEver attribute to set it to True.
-        getLegalMoves: Accessor method for the _legalMoves attribute.
-        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions.
-        removeLegalMove: Mutator method for the _legalMoves attribute to remove any moves which have the same destination as the parameter.
+        getLegalMoves: Accessor method for the _legalMoves attribute to decode it into a list of moves.
+        getMoveBitboard: Accessor method for the _legalMoves attribute.
+        getMoveFlags: Accessor method for the _legalMoveFlags attribute.
+        setLegalMoves: Mutator method for the _legalMoves and _legalMoveFlags attributes.
+        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions, or from the move cache.
+        removeLegalMove: Mutator method for the _legalMoves and _legalMoveFlags attributes to remove any move which has the same destination as the parameter.
         move: Set the _square and _pos attributes to reflect a piece movement.
         update: Call the Switch update method if it is this piece's turn.
         encodeInt: Encode and return the piece as an integer.
+        saveState: Return the square and moved ever attribute of the piece.
+        restoreState: Return the piece to a saved state.
+        batchRender: Draw many pieces onto a surface with a single blit call.
 
     Attributes:
         _size (pg.Vector2): The size of the button - the shape will be a rect based on this.
@@ -361,15 +570,18 @@ class Bishop(Piece):
         _squareSize (pg.Vector2): The size of each board square, and thus the piece as well.
         _team (bool): False for white team and True for black team.
         _square (pg.Vector2): The board square (i.e. index of the board array) which this piece inhabits.
-        _legalMoves (list): A list of all legal moves this piece can make.
+        _legalMoves (int): A bitboard of the destination squares of all legal moves this piece can make.
+        _legalMoveFlags (dict): The special move flag of any destination square in _legalMoves which is reached by a special move.
         _value (int): The piece type's arbitrary integer value.
+        _assetNames (tuple): The file names of the white and black images of the piece type.
+        _extraAttributes (tuple): The names of any extra boolean attributes of the piece type, which start as False.
+        _directions (tuple): The (dx, dy, slide) directions which the piece type moves in, which is empty for the pawn.
     """
 
-    # Initialise an object of this class when called
-    def __init__(self, size: pg.Vector2, square: pg.Vector2, team: bool) -> None:
-        # Define attributes
-        self._value: int = 3
-        super().__init__(size, square, pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + ["\\Assets\\White Bishop.png", "\\Assets\\Black Bishop.png"][team]).convert_alpha(), size), team)
+    # Define the class attributes read by the Piece constructor
+    _value: int = 3
+    _assetNames: tuple = ("White Bishop.png", "Black Bishop.png")
+    _directions: tuple = PIECE_DIRECTIONS[3]
 
 
 # Create the knight class
@@ -388,12 +600,18 @@ class Knight(Piece):
         getSquare: Accessor method for the _square attribute.
         getMovedEver: Accessor method for the _movedEver attribute.
         movedEverTrue: Mutator method for the _movedEver attribute to set it to True.
-        getLegalMoves: Accessor method for the _legalMoves attribute.
-        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions.
-        removeLegalMove: Mutator method for the _legalMoves attribute to remove any moves which have the same destination as the parameter.
+        getLegalMoves: Accessor method for the _legalMoves attribute to decode it into a list of moves.
+        getMoveBitboard: Accessor method for the _legalMoves attribute.
+        getMoveFlags: Accessor method for the _legalMoveFlags attribute.
+        setLegalMoves: Mutator method for the _legalMoves and _legalMoveFlags attributes.
+        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions, or from the move cache.
+        removeLegalMove: Mutator method for the _legalMoves and _legalMoveFlags attributes to remove any move which has the same destination as the parameter.
         move: Set the _square and _pos attributes to reflect a piece movement.
         update: Call the Switch update method if it is this piece's turn.
         encodeInt: Encode and return the piece as an integer.
+        saveState: Return the square and moved ever attribute of the piece.
+        restoreState: Return the piece to a saved state.
+        batchRender: Draw many pieces onto a surface with a single blit call.
 
     Attributes:
         _size (pg.Vector2): The size of the button - the shape will be a rect based on this.
@@ -406,15 +624,18 @@ class Knight(Piece):
         _squareSize (pg.Vector2): The size of each board square, and thus the piece as well.
         _team (bool): False for white team and True for black team.
         _square (pg.Vector2): The board square (i.e. index of the board array) which this piece inhabits.
-        _legalMoves (list): A list of all legal moves this piece can make.
+        _legalMoves (int): A bitboard of the destination squares of all legal moves this piece can make.
+        _legalMoveFlags (dict): The special move flag of any destination square in _legalMoves which is reached by a special move.
         _value (int): The piece type's arbitrary integer value.
+        _assetNames (tuple): The file names of the white and black images of the piece type.
+        _extraAttributes (tuple): The names of any extra boolean attributes of the piece type, which start as False.
+        _directions (tuple): The (dx, dy, slide) directions which the piece type moves in, which is empty for the pawn.
     """
 
-    # Initialise an object of this class when called
-    def __init__(self, size: pg.Vector2, square: pg.Vector2, team: bool) -> None:
-        # Define attributes
-        self._value: int = 2
-        super().__init__(size, square, pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + ["\\Assets\\White Knight.png", "\\Assets\\Black Knight.png"][team]).convert_alpha(), size), team)
+    # Define the class attributes read by the Piece constructor
+    _value: int = 2
+    _assetNames: tuple = ("White Knight.png", "Black Knight.png")
+    _directions: tuple = PIECE_DIRECTIONS[2]
 
 # Create the rook class
 class Rook(Piece):
@@ -433,12 +654,18 @@ class Rook(Piece):
         getSquare: Accessor method for the _square attribute.
         getMovedEver: Accessor method for the _movedEver attribute.
         movedEverTrue: Mutator method for the _movedEver attribute to set it to True.
-        getLegalMoves: Accessor method for the _legalMoves attribute.
-        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions.
-        removeLegalMove: Mutator method for the _legalMoves attribute to remove any moves which have the same destination as the parameter.
+        getLegalMoves: Accessor method for the _legalMoves attribute to decode it into a list of moves.
+        getMoveBitboard: Accessor method for the _legalMoves attribute.
+        getMoveFlags: Accessor method for the _legalMoveFlags attribute.
+        setLegalMoves: Mutator method for the _legalMoves and _legalMoveFlags attributes.
+        updateLegalMoves: Mutator method for the _legalMoves attribute to update it by calling the module functions, or from the move cache.
+        removeLegalMove: Mutator method for the _legalMoves and _legalMoveFlags attributes to remove any move which has the same destination as the parameter.
         move: Set the _square and _pos attributes to reflect a piece movement.
         update: Call the Switch update method if it is this piece's turn.
         encodeInt: Encode and return the piece as an integer.
+        saveState: Return the square and moved ever attribute of the piece.
+        restoreState: Return the piece to a saved state.
+        batchRender: Draw many pieces onto a surface with a single blit call.
 
     Attributes:
         _size (pg.Vector2): The size of the button - the shape will be a rect based on this.
@@ -451,25 +678,27 @@ class Rook(Piece):
         _squareSize (pg.Vector2): The size of each board square, and thus the piece as well.
         _team (bool): False for white team and True for black team.
         _square (pg.Vector2): The board square (i.e. index of the board array) which this piece inhabits.
-        _legalMoves (list): A list of all legal moves this piece can make.
+        _legalMoves (int): A bitboard of the destination squares of all legal moves this piece can make.
+        _legalMoveFlags (dict): The special move flag of any destination square in _legalMoves which is reached by a special move.
         _value (int): The piece type's arbitrary integer value.
+        _assetNames (tuple): The file names of the white and black images of the piece type.
+        _extraAttributes (tuple): The names of any extra boolean attributes of the piece type, which start as False.
+        _directions (tuple): The (dx, dy, slide) directions which the piece type moves in, which is empty for the pawn.
         _movedEver (bool): Whether this piece has ever moved.
     """
 
-    # Initialise an object of this class when called
-    def __init__(self, size: pg.Vector2, square: pg.Vector2, team: bool) -> None:
-        # Define attributes
-        self._value: int = 1
-        super().__init__(size, square, pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + ["\\Assets\\White Rook.png", "\\Assets\\Black Rook.png"][team]).convert_alpha(), size), team)
-        # Define the moved attribute to allow for castling
-        self._movedEver: bool = False
+    # Define the class attributes read by the Piece constructor
+    _value: int = 1
+    _assetNames: tuple = ("White Rook.png", "Black Rook.png")
+    _directions: tuple = PIECE_DIRECTIONS[1]
+    _extraAttributes: tuple = ("_movedEver",)
 
 
 # Create the pawn class
 class Pawn(Piece):
     """The chess pawn.
 
-    Stores the _movedEver and _doubleMoved attributes on top of the common ones, and is the least valuable piece in the game.
+    Stores the _movedEver attribute on top of the common ones, and is the least valuable piece in the game.
     However, it has the double and en passant special moves, and if it reaches the opponent's home rank it can promote into any piece other than the king.
     
     Constructor:
@@ -482,14 +711,18 @@ class Pawn(Piece):
         getSquare: Accessor method for the _square attribute.
         getMovedEver: Accessor method for the _movedEver attribute.
         movedEverTrue: Mutator method for the _movedEver attribute to set it to True.
-        getLegalMoves: Accessor method for the _legalMoves attribute.
+        getLegalMoves: Accessor method for the _legalMoves attribute to decode it into a list of moves.
+        getMoveBitboard: Accessor method for the _legalMoves attribute.
+        getMoveFlags: Accessor method for the _legalMoveFlags attribute.
+        setLegalMoves: Mutator method for the _legalMoves and _legalMoveFlags attributes.
         updateLegalMoves: Overwritten from the Piece class to call the pawn-specific function.
-        removeLegalMove: Mutator method for the _legalMoves attribute to remove any moves which have the same destination as the parameter.
+        removeLegalMove: Mutator method for the _legalMoves and _legalMoveFlags attributes to remove any move which has the same destination as the parameter.
         move: Set the _square and _pos attributes to reflect a piece movement.
-        update: Overwritten from the Piece class to also reset the _doubleMoved attribute.
+        update: Call the Switch update method if it is this piece's turn.
         encodeInt: Encode and return the piece as an integer.
-        getDoubleMoved: Accessor method for the _doubleMoved attribute.
-        doubleMovedTrue: Mutator method for the _doubleMoved attribute to set it to True.
+        saveState: Return the square and moved ever attribute of the piece.
+        restoreState: Return the piece to a saved state.
+        batchRender: Draw many pieces onto a surface with a single blit call.
 
     Attributes:
         _size (pg.Vector2): The size of the button - the shape will be a rect based on this.
@@ -502,127 +735,280 @@ class Pawn(Piece):
         _squareSize (pg.Vector2): The size of each board square, and thus the piece as well.
         _team (bool): False for white team and True for black team.
         _square (pg.Vector2): The board square (i.e. index of the board array) which this piece inhabits.
-        _legalMoves (list): A list of all legal moves this piece can make.
+        _legalMoves (int): A bitboard of the destination squares of all legal moves this piece can make.
+        _legalMoveFlags (dict): The special move flag of any destination square in _legalMoves which is reached by a special move.
         _value (int): The piece type's arbitrary integer value.
+        _assetNames (tuple): The file names of the white and black images of the piece type.
+        _extraAttributes (tuple): The names of any extra boolean attributes of the piece type, which start as False.
+        _directions (tuple): The (dx, dy, slide) directions which the piece type moves in, which is empty for the pawn.
         _movedEver (bool): Whether this piece has ever moved.
-        _doubleMoved (bool): Whether this piece just made a double move.
     """
 
-    # Initialise an object of this class when called
-    def __init__(self, size: pg.Vector2, square: pg.Vector2, team: bool) -> None:
-        # Define attributes
-        self._value: int = 0
-        super().__init__(size, square, pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + ["\\Assets\\White Pawn.png", "\\Assets\\Black Pawn.png"][team]).convert_alpha(), size), team)
-        # Define the moved ever attribute to allow for the double size first move
-        self._movedEver: bool = False
-        # Define the double moved attribute to allow for en passant
-        self._doubleMoved: bool = False
-
-    def getDoubleMoved(self) -> bool:
-        """Return the double moved attribute."""
-        return self._doubleMoved
-    
-    def doubleMovedTrue(self) -> None:
-        """Set the double moved attribute to True."""
-        self._doubleMoved = True
+    # Define the class attributes read by the Piece constructor
+    _value: int = 0
+    _assetNames: tuple = ("White Pawn.png", "Black Pawn.png")
+    _extraAttributes: tuple = ("_movedEver",)
 
-    # Overwrite the update method to reset double moved
-    def update(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool, turn: bool) -> None:
-        """Set the _doubleMoved attribute to False if it is the pawn's turn, and then call the Piece class update method."""
-        if self._doubleMoved and turn == self._team:
-            self._doubleMoved = False
-        super().update(events, mousePos, leftMousePressed, turn)
-
-    def updateLegalMoves(self, moveList: list, board: list, turn: bool) -> None:
-        """Overwrite the update legal moves method to run the pawn-specific one."""
-        self._legalMoves = updatePawnMoves(self._team, turn, self._square, self, board)
+    def updateLegalMoves(self, board: list, turn: bool, position: None | tuple=None, occupancy: None | tuple=None, pawnMoves: None | dict=None) -> None:
+        """Overwrite the update legal moves method to run the pawn-specific one, or take its moves from those found for every pawn by the board if the occupancy bitboards of each team are given."""
+        if not self._loadCachedMoves(board, turn, position):
+            if occupancy == None:
+                self._encodeMoves(updatePawnMoves(self._team, turn, squareIndex(self._square), self.encodeInt(), encodeBoard(board)), board)
+            else:
+                self.setLegalMoves(*pawnMoves[squareIndex(self._square)])
+                threatenKings(self._legalMoves & occupancy[not self._team], board)
+            self._storeCachedMoves(turn, position)
 
 
 # Define static methods to handle piece move generation
-def onBoard(square: pg.Vector2) -> bool:
-    """Return whether a square is on the board or not."""
-    return (0 <= square.x <= 7) and (0 <= square.y <= 7)
+def onBoard(square: int) -> bool:
+    """Return whether a square, given as a bitboard index, is within the board's ranks, which is all a vertical pawn step needs checking since it cannot wrap around an edge."""
+    return 0 <= square < 64
 
-def infDist(team: bool, square: pg.Vector2, agent: int | Queen | Bishop | Rook, move: tuple, board: list) -> list:
-    """Find a list of all possible moves based on a move option with unlimited distance.
+def squareIndex(square: pg.Vector2) -> int:
+    """Return the bitboard index of a square, where the index is y * 8 + x."""
+    return int(square.y) * 8 + int(square.x)
 
-    Use indefinite iteration to find all possible moves given a move option with unlimited distance.
+def iterBits(bitboard: int):
+    """Yield the index of every set bit in a bitboard, from least to most significant, by repeatedly isolating the lowest set bit."""
+    while bitboard:
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+def rotateBitboard(bitboard: int) -> int:
+    """Return a bitboard rotated by 180 degrees, which maps each index i to 63 - i by reversing the order of the bits."""
+    return int(format(bitboard, "064b")[::-1], 2)
+
+def buildLines() -> tuple:
+    """Build the tables describing the line joining every pair of squares.
+
+    For every pair of squares, find whether they share a rank or file (orthogonal, 1) or a diagonal (diagonal, 2),
+    and the bitboard of all squares strictly between them, so that ray intersections can be found with a single AND.
 
     Args:
-        team (bool): The team of the piece whose moves are being checked.
-        square (pg.Vector2): The current position of moving piece.
-        agent (int | Queen | Bishop | Rook): The piece whose moves are being checked.
-        move (tuple): The specific move whose possibilities are being evaluated.
-        board (list): The board list, containing all pieces at their positions.
+        None
 
     Kwargs:
         None
 
     Returns:
-        A list of possible moves.
+        A tuple of the line type table and the between bitboard table, both indexed [from][to].
     """
-    # Define anonymous functions depending on whether the function is dealing with real pieces or integer representations
-    if isinstance(agent, int):
-        getTeam = lambda target: target % 2
-        addMove = lambda dest: moves.append((square, dest))
-    else:
-        getTeam = lambda target: target.getTeam()
-        addMove = lambda dest: moves.append((dest, agent))
+    lineTypes = [[0] * 64 for square in range(64)]
+    between = [[0] * 64 for square in range(64)]
+    for start in range(64):
+        for dx, dy in [(x, y) for x in [-1, 0, 1] for y in [-1, 0, 1] if (x, y) != (0, 0)]:
+            x = (start % 8) + dx
+            y = (start // 8) + dy
+            passed = 0
+            # Walk along the ray, recording every square passed on the way to each destination
+            while 0 <= x <= 7 and 0 <= y <= 7:
+                lineTypes[start][y * 8 + x] = 2 if dx and dy else 1
+                between[start][y * 8 + x] = passed
+                passed |= 1 << (y * 8 + x)
+                x += dx
+                y += dy
+    return lineTypes, between
+
+def buildRays() -> tuple:
+    """Build the tables of rays from every square in each of the eight directions.
+
+    Each ray is the bitboard of every square from (but not including) the start square to the edge of the board,
+    so that a sliding piece's moves in one direction are the ray up to and including the first occupied square.
+    The same squares are also kept as a tuple of indices in order of distance, so that a ray can be walked without checking the edges of the board.
 
-    moves = []
-    # Repeat this moving in both positive and negative directions
-    for changer in [(lambda base: base + 1), (lambda base: base - 1)]:
-        validMove = True
-        x = 0
-        y = 0
-        inf = 0
-
-        # Repeat while the move can still be valid
-        while validMove:
-            inf = changer(inf)
-            # If that component of the move is x, replace it with the infinite move variable, and if the x component is mx, subtract the infinite variable instead
-            if move[0] == "x":
-                x = int(square.x + inf)
-            elif move[0] == "mx":
-                x = int(square.x - inf)
-            else:
-                x = int(square.x + move[0])
-            if move[1] == "x":
-                y = int(square.y + inf)
-            else:
-                y = int(square.y + move[1])
+    Args:
+        None
 
-            # Only bother target checking if the move is within bounds
-            if onBoard(pg.Vector2(x, y)):
-                target = board[x][y]
+    Kwargs:
+        None
 
-                # The decision to append this move and keep going with the next depends on the target
-                if target == None:
-                    addMove(pg.Vector2(x, y))
+    Returns:
+        A tuple of the ray bitboard table, indexed [direction][square] with the directions in the order of the DIRECTIONS list,
+        and the ray square table, indexed [(dx, dy)][square].
+    """
+    rays = [[0] * 64 for direction in DIRECTIONS]
+    raySquares = {}
+    for direction, (dx, dy) in enumerate(DIRECTIONS):
+        raySquares[(dx, dy)] = []
+        for start in range(64):
+            squares = []
+            x = (start % 8) + dx
+            y = (start // 8) + dy
+            while 0 <= x <= 7 and 0 <= y <= 7:
+                rays[direction][start] |= 1 << (y * 8 + x)
+                squares.append(y * 8 + x)
+                x += dx
+                y += dy
+            raySquares[(dx, dy)].append(tuple(squares))
+    return rays, raySquares
+
+def buildStepTables() -> tuple:
+    """Build the tables of knight and king attacks from every square.
+
+    Neither piece's moves depend on the occupancy of the squares in between, so each is a fixed set of offsets
+    which only needs to be checked against the edges of the board once for every square.
 
-                elif getTeam(target) != team:
-                    addMove(pg.Vector2(x, y))
-                    if isinstance(target, King):
-                        target.threatenedTrue()
-                    validMove = False
+    Args:
+        None
 
-                else:
-                    validMove = False
-            else:
-                validMove = False
-    return moves
+    Kwargs:
+        None
+
+    Returns:
+        A tuple of the knight and king attack bitboard tables, indexed by square.
+    """
+    knightOffsets = [(x, y) for x in [-2, -1, 1, 2] for y in [-2, -1, 1, 2] if abs(x) != abs(y)]
+    knights = [0] * 64
+    kings = [0] * 64
+    for square in range(64):
+        for table, offsets in ((knights, knightOffsets), (kings, DIRECTIONS)):
+            for dx, dy in offsets:
+                x = (square % 8) + dx
+                y = (square // 8) + dy
+                if 0 <= x <= 7 and 0 <= y <= 7:
+                    table[square] |= 1 << (y * 8 + x)
+    return knights, kings
+
+def buildStepMasks() -> dict:
+    """Build the bitboards of the squares from which each single step stays on the board.
+
+    A step off the top or bottom of the board simply leaves the range of the bitboard indices, but a step off the side
+    wraps around onto the next rank, so the edge files which the step would wrap from are masked out as well.
+
+    Args:
+        None
+
+    Kwargs:
+        None
+
+    Returns:
+        A dictionary of the mask bitboards, keyed by the (dx, dy) step.
+    """
+    masks = {}
+    for dx in range(-2, 3):
+        for dy in range(-2, 3):
+            mask = (FULL_BOARD >> (8 * dy)) if dy >= 0 else ((FULL_BOARD << (-8 * dy)) & FULL_BOARD)
+            for file in range(abs(dx)):
+                mask &= ~((FILE_H >> file) if dx > 0 else (FILE_A << file))
+            masks[(dx, dy)] = mask
+    return masks
+
+def buildPawnTables() -> list:
+    """Build the table of pawn attacks from every square.
 
-def updateRegularMoves(team: bool, square: pg.Vector2, agent: int | King | Queen | Bishop | Knight | Rook, moveList: list, board: list) -> list:
+    The table is indexed [active][square], where an active pawn moves up the board (decreasing y) and an inactive one moves down it,
+    since the board is rotated every turn so that the current team is always at the bottom.
+
+    Args:
+        None
+
+    Kwargs:
+        None
+
+    Returns:
+        The attack bitboard table.
+    """
+    attacks = [[0] * 64 for active in range(2)]
+    for square in range(64):
+        x = square % 8
+        y = square // 8
+        for active, direction in ((0, 1), (1, -1)):
+            if 0 <= y + direction <= 7:
+                # Respect the edges of the board for the diagonal attacks
+                for dx in (-1, 1):
+                    if 0 <= x + dx <= 7:
+                        attacks[active][square] |= 1 << (square + 8 * direction + dx)
+    return attacks
+
+def buildCastleMasks() -> list:
+    """Build the bitboards of the squares between the king and each rook, which must all be empty for a castle.
+
+    The king and rooks sit on different files depending on which team is at the bottom of the board,
+    so the table is indexed [active][turn], and each entry holds the left and then the right mask.
+
+    Args:
+        None
+
+    Kwargs:
+        None
+
+    Returns:
+        The table of left and right castle masks.
+    """
+    masks = [[None, None], [None, None]]
+    for active in (False, True):
+        for turn in (False, True):
+            row = active * 7
+            left = sum(1 << (row * 8 + x) for x in range((((not active) * 4) + bool((not turn) + active)), (((not active) * 4) + 3 + (not turn) * active)))
+            right = sum(1 << (row * 8 + x) for x in range((active * 4 + (not (turn * active))), (active * 4 + 3 + (not (turn + active)))))
+            masks[active][turn] = (left, right)
+    return masks
+
+# The bitboards of every square, and of the left and right files, which stop pieces stepped sideways from wrapping around the board
+FULL_BOARD: int = (1 << 64) - 1
+FILE_A: int = 0x0101010101010101
+FILE_H: int = FILE_A << 7
+
+# The bit of an integer piece's flags (its code modulo 10) which is set once it has ever moved, and clear while the piece can still castle or double move
+MOVED_EVER_BIT: int = 2
+
+# The line, ray, attack and pawn tables only depend on the board geometry, so they are built once when the module is imported
+LINE_TYPES, BETWEEN = buildLines()
+RAYS, RAY_SQUARES = buildRays()
+KNIGHT_ATTACKS, KING_ATTACKS = buildStepTables()
+STEP_ATTACKS = {2: KNIGHT_ATTACKS, 5: KING_ATTACKS}
+STEP_MASKS = buildStepMasks()
+PAWN_ATTACKS = buildPawnTables()
+CASTLE_BETWEEN = buildCastleMasks()
+
+# The bitboard index of the square of a king which can still castle, indexed [active][turn] in the same way as the castle masks
+CASTLE_KING_SQUARES: tuple = ((4, 3), (60, 59))
+
+def infDist(team: bool, square: int, stepX: int, stepY: int, board: list, moves: list) -> None:
+    """Append every move along a single direction with unlimited distance from a square to a list of moves.
+
+    Walk the precomputed squares of the ray in that direction until either its end or a piece is reached, adding each empty square,
+    and the square of the piece as well if it is on the opposing team.
+
+    Args:
+        team (bool): The team of the piece whose moves are being checked.
+        square (int): The bitboard index of the current position of the moving piece.
+        stepX (int): The change in x of each step along the direction.
+        stepY (int): The change in y of each step along the direction.
+        board (list): The flat board list, containing all integer pieces at their bitboard indices.
+        moves (list): The list of moves to which any possible moves are appended.
+
+    Kwargs:
+        None
+
+    Returns:
+        None
+    """
+    appendMove = moves.append
+    for dest in RAY_SQUARES[(stepX, stepY)][square]:
+        target = board[dest]
+
+        # The decision to append this move and keep going with the next depends on the target
+        if target == None:
+            appendMove((square, dest))
+        else:
+            if target % 2 != team:
+                appendMove((square, dest))
+            break
+
+def updateRegularMoves(team: bool, square: int, agent: int, directions: tuple, board: list) -> list:
     """Find a list of all possible moves for all non-pawn pieces.
 
-    Use the piece's move list to check which moves are valid and return all of those at the end.
+    Use the piece's directions to check which moves are valid and return all of those at the end.
 
     Args:
         team (bool): The team of the piece whose moves are being checked.
-        square (pg.Vector2): The current position of moving piece.
-        agent (int | Queen | Bishop | Rook): The piece whose moves are being checked.
-        moveList (list): The list of all of that piece's moves.
-        board (list): The board list, containing all pieces at their positions.
+        square (int): The bitboard index of the current position of the moving piece.
+        agent (int): The integer code of the piece whose moves are being checked.
+        directions (tuple): The (dx, dy, slide) directions of all of that piece's moves.
+        board (list): The flat board list, containing all integer pieces at their bitboard indices.
 
     Kwargs:
         None
@@ -630,35 +1016,91 @@ def updateRegularMoves(team: bool, square: pg.Vector2, agent: int | King | Queen
     Returns:
         A list of possible moves.
     """
-    # Define anonymous functions depending on whether the function is dealing with real pieces or integer representations
-    if isinstance(agent, int):
-        getTeam = lambda target: target % 2
-        addMove = lambda dest: moves.append((square, dest))
-    else:
-        getTeam = lambda target: target.getTeam()
-        addMove = lambda dest: moves.append((dest, agent))
-
     moves = []
-    for move in moveList:
+    # Look up the append method once, rather than on every move
+    appendMove = moves.append
+    for dx, dy, slide in directions:
 
-        # Iterate through all valid squares if the move value is an x, otherwise simply add the moves to the list
-        if move[0] == "x" or move[1] == "x":
-            moves += infDist(team, square, agent, move, board)
+        # Iterate through all valid squares if the direction slides, otherwise simply add the moves to the list
+        if slide:
+            infDist(team, square, dx, dy, board, moves)
         else:
-            toAdd = (int(square.x + move[0]), int(square.y + move[1]))
 
-            # Only check the target if the move is within bounds
-            if onBoard(pg.Vector2(toAdd)):
-                target = board[toAdd[0]][toAdd[1]]
+            # Only check the target if the step cannot leave the board from this square
+            if (STEP_MASKS[(dx, dy)] >> square) & 1:
+                toAdd = square + dy * 8 + dx
+                target = board[toAdd]
                 
-                # If the space is free for the purposes of movement, add that to the move list
-                if target == None or getTeam(target) != team:
-                    addMove(pg.Vector2(toAdd))
-                    if isinstance(target, King):
-                        target.threatenedTrue()
+                # If the space is free for the purposes of movement, add that to the move list, where the team of an integer piece is its parity
+                if target == None or target % 2 != team:
+                    appendMove((square, toAdd))
+    return moves
+
+def threatenKings(captures: int, board: list) -> None:
+    """Set the threatened attribute of any king on the squares of a bitboard of captures to True."""
+    for target in iterBits(captures):
+        if isinstance(board[target % 8][target // 8], King):
+            board[target % 8][target // 8].threatenedTrue()
+
+def slidingBitboard(index: int, value: int, occupied: int) -> int:
+    """Return the bitboard of every square a sliding piece of a given value attacks from a square, given the occupied squares.
+
+    Along each direction the piece can slide in, take the ray from the square and cut it off after the first occupied square,
+    which is the lowest set bit of the blockers for directions which increase the index and the highest for those which decrease it.
+
+    Args:
+        index (int): The bitboard index of the square of the sliding piece.
+        value (int): The value of the sliding piece, which decides its directions.
+        occupied (int): The bitboard of all occupied squares.
+
+    Kwargs:
+        None
+
+    Returns:
+        The bitboard of attacked squares, including any occupied by the piece's own team.
+    """
+    attacks = 0
+    for direction in SLIDE_DIRECTIONS[value]:
+        ray = RAYS[direction][index]
+        blockers = ray & occupied
+        if blockers:
+            if DIRECTION_STEPS[direction] > 0:
+                first = (blockers & -blockers).bit_length() - 1
+            else:
+                first = blockers.bit_length() - 1
+            ray ^= RAYS[direction][first]
+        attacks |= ray
+    return attacks
+
+def updateBitboardMoves(team: bool, index: int, agent: King | Queen | Bishop | Knight | Rook, board: list, occupancy: tuple) -> int:
+    """Find the bitboard of all possible moves for a non-pawn piece.
+
+    Find the same moves as the updateRegularMoves function, but using the precomputed rays for sliding pieces
+    and the precomputed attack tables for the knight and king, along with the occupancy bitboards of each team,
+    so that no square is visited one at a time.
+
+    Args:
+        team (bool): The team of the piece whose moves are being checked.
+        index (int): The bitboard index of the current position of the moving piece.
+        agent (King | Queen | Bishop | Knight | Rook): The piece whose moves are being checked.
+        board (list): The board list, containing all pieces at their positions.
+        occupancy (tuple): The bitboards of the squares occupied by each team, indexed by team.
+
+    Kwargs:
+        None
+
+    Returns:
+        The bitboard of all possible move destinations.
+    """
+    value = agent.getValue()
+    if value in SLIDE_DIRECTIONS:
+        moves = slidingBitboard(index, value, occupancy[0] | occupancy[1]) & ~occupancy[team]
+    else:
+        moves = STEP_ATTACKS[value][index] & ~occupancy[team]
+    threatenKings(moves & occupancy[not team], board)
     return moves
 
-def updateCastle(active: bool, turn: bool, agent: int | King, board: list) -> list:
+def updateCastle(active: bool, turn: bool, agent: int, board: list, occupied: None | int=None) -> list:
     """Return the legal castle moves (if any).
 
     Check for possible castle moves on both sides, checking against the criteria:
@@ -668,48 +1110,42 @@ def updateCastle(active: bool, turn: bool, agent: int | King, board: list) -> li
     Args:
         active (bool): Whether it is currently the turn of the king in question.
         turn (bool): The current turn in the game.
-        agent (int | Queen | Bishop | Rook): The piece whose moves are being checked.
-        board (list): The board list, containing all pieces at their positions.
+        agent (int): The integer code of the king whose moves are being checked.
+        board (list): The flat board list, containing all integer pieces at their bitboard indices.
 
     Kwargs:
-        None
+        occupied (None | int) = None: The bitboard of all occupied squares, which is found from the king's row of the board if not given.
 
     Returns:
         A list of possible castle moves.
     """
-    # Define anonymous functions depending on whether the function is dealing with real pieces or integer representations
-    if isinstance(agent, int):
-        isRookNeverMoved = lambda piece: (piece // 10 == 4) and ((piece % 10) % 4 == (0 or 1))
-        addMove = lambda dest: moves.append((pg.Vector2(4 - turn, activeRow), pg.Vector2(dest[0], dest[1]), dest[2]))
-    else:
-        isRookNeverMoved = lambda piece: isinstance(piece, Rook) and not piece.getMovedEver()
-        addMove = lambda dest: moves.append((dest, agent))
-
     moves = []
+    kingSquare = CASTLE_KING_SQUARES[active][turn]
     activeRow = active * 7
     lEnd = 6 - (turn + (active * 4))
     rEnd = 6 - (turn + ((not active) * 4))
-
-    # Check left side castling
-    if isRookNeverMoved(board[7 - activeRow][activeRow]): # The rook in question will be the piece at the bottom left or top right square
-        # Check whether the squares on the left hand side of the king are free
-        # List comprehension for greater efficiency iterates between all squares between the king and rook checking that they are empty.
-        if not [None for x in range((((not active) * 4) + bool((not turn) + active)), (((not active) * 4) + 3 + (not turn) * active)) if board[x][activeRow] != None]:
-            addMove((lEnd, activeRow, "lc"))
-
-    # Check right side castling
-    if isRookNeverMoved(board[activeRow][activeRow]): # The rook in question will be the piece at the bottom right or top left square
-        # Check whether the squares on the left hand side of the king are free
-        # List comprehension for greater efficiency iterates between all squares between the king and rook checking that they are empty.
-        if not [None for x in range((active * 4 + (not (turn * active))), (active * 4 + 3 + (not (turn + active)))) if board[x][activeRow] != None]:
-            addMove((rEnd, activeRow, "rc"))
+    leftMask, rightMask = CASTLE_BETWEEN[active][turn]
+    # Only the squares on the king's row are ever checked, so that is all that needs finding if the occupied bitboard is not given
+    if occupied == None:
+        occupied = sum(1 << (activeRow * 8 + x) for x in range(8) if board[activeRow * 8 + x] != None)
+
+    # Check left side castling, where the rook in question will be the piece at the bottom left or top right square, and the squares on the left hand side of the king are free
+    # An unmoved rook is one with a value of 1 whose flags do not have the moved ever bit set
+    rook = board[activeRow * 8 + 7 - activeRow]
+    if rook != None and rook // 10 == 1 and not (rook % 10) & MOVED_EVER_BIT and freeCheck(leftMask, occupied):
+        moves.append((kingSquare, activeRow * 8 + lEnd, "lc"))
+
+    # Check right side castling, where the rook in question will be the piece at the bottom right or top left square, and the squares on the right hand side of the king are free
+    rook = board[activeRow * 9]
+    if rook != None and rook // 10 == 1 and not (rook % 10) & MOVED_EVER_BIT and freeCheck(rightMask, occupied):
+        moves.append((kingSquare, activeRow * 8 + rEnd, "rc"))
     return moves
 
-def freeCheck(squares: list, board: list) -> bool:
-    """Return whether a list of board squares are empty."""
-    return not [None for square in squares if board[square[0]][square[1]] != None]
+def freeCheck(mask: int, occupied: int) -> bool:
+    """Return whether all of the squares in a bitboard mask are empty."""
+    return not (occupied & mask)
 
-def updatePawnMoves(team: bool, turn: bool, square: pg.Vector2, agent: int | Pawn, board: list) -> list:
+def updatePawnMoves(team: bool, turn: bool, square: int, agent: int, board: list) -> list:
     """Find a list of all possible moves able to be made by a pawn.
 
     Find all moves, including special ones, which can be made by a pawn and return them.
@@ -718,9 +1154,9 @@ def updatePawnMoves(team: bool, turn: bool, square: pg.Vector2, agent: int | Paw
     Args:
         team (bool): The team of the pawn whose moves are being checked.
         turn (bool): The current turn in the game.
-        square (pg.Vector2): The current position of moving piece.
-        agent (int | Queen | Bishop | Rook): The piece whose moves are being checked.
-        board (list): The board list, containing all pieces at their positions.
+        square (int): The bitboard index of the current position of the moving piece.
+        agent (int): The integer code of the pawn whose moves are being checked.
+        board (list): The flat board list, containing all integer pieces at their bitboard indices.
 
     Kwargs:
         None
@@ -728,21 +1164,9 @@ def updatePawnMoves(team: bool, turn: bool, square: pg.Vector2, agent: int | Paw
     Returns:
         A list of all possible moves.
     """
-    # Define anonymous functions depending on whether the function is dealing with real pieces or integer representations
-    if isinstance(agent, int):
-        getTeam = lambda target: target % 2
-        getMovedEver = lambda target: (target // 2) % 2 != 0
-        isPawn = lambda target: target // 10 == 5
-        doubleMoved = lambda target: (target % 10) // 4
-        addMove = lambda dest: moves.append((square, dest)) if isinstance(dest, pg.Vector2) else moves.append((square, pg.Vector2(dest[0], dest[1]), dest[2]))
-    else:
-        getTeam = lambda target: target.getTeam()
-        getMovedEver = lambda target: target.getMovedEver()
-        isPawn = lambda target: isinstance(target, Pawn)
-        doubleMoved = lambda target: target.getDoubleMoved()
-        addMove = lambda dest: moves.append((dest, agent))
-
+    # The attributes of the integer pieces are read directly from their codes, where the team is bit 0, the moved ever flag bit 1 and the double moved flag bit 2
     moves = []
+    appendMove = moves.append
 
     # Make turn positive if the piece is active and negative if not
     if team == turn:
@@ -751,37 +1175,163 @@ def updatePawnMoves(team: bool, turn: bool, square: pg.Vector2, agent: int | Paw
         turn = 1
 
     # Check that the regular move is valid
-    toAdd = (int(square.x), int(square.y + turn))
-    if onBoard(pg.Vector2(toAdd)) and freeCheck([toAdd], board):
-        addMove(pg.Vector2(toAdd))
+    toAdd = square + turn * 8
+    if onBoard(toAdd) and board[toAdd] == None:
+        appendMove((square, toAdd))
 
         # Check the double move
-        if not getMovedEver(agent):
-            toAdd = (int(square.x), int(square.y + (2 * turn)))
-            if onBoard(pg.Vector2(toAdd)) and freeCheck([toAdd], board):
-                toAdd = tuple(toAdd) + tuple("d")
-                addMove(toAdd)
+        if not agent & MOVED_EVER_BIT:
+            toAdd = square + turn * 16
+            if onBoard(toAdd) and board[toAdd] == None:
+                appendMove((square, toAdd, "d"))
 
-    # Check for taking on both sides at the same time as en passant
-    for toAdd in [(int(square.x - 1), int(square.y + turn)), (int(square.x + 1), int(square.y + turn))]:
-        if 0 <= toAdd[0] <= 7 and 0 <= toAdd[1] <= 7:
-            target = board[toAdd[0]][toAdd[1]]
+    # Check for taking on both sides at the same time as en passant, where the step masks stop either diagonal from leaving the board
+    for dx in (-1, 1):
+        if (STEP_MASKS[(dx, turn)] >> square) & 1:
+            toAdd = square + turn * 8 + dx
+            target = board[toAdd]
 
             # If there is a piece at a diagonal to the pawn, add that square to the move list
             if target != None:
-                if getTeam(target) != team:
-                    addMove(pg.Vector2(toAdd))
-                    if isinstance(target, King):
-                        target.threatenedTrue()
+                if target % 2 != team:
+                    appendMove((square, toAdd))
 
             # Check for pawns orthogonally adjacent to the subject pawn which have just moved twice, as an en passant can occur here
             else:
-                target = board[toAdd[0]][toAdd[1] - turn]
-                if target != None and isPawn(target) and doubleMoved(target) and getTeam(target) != team:
-                    toAdd += tuple("e")
-                    addMove(toAdd)
+                target = board[square + dx]
+                if target != None and target < 10 and (target % 10) // 4 and target % 2 != team:
+                    appendMove((square, toAdd, "e"))
     return moves
 
+def updateSidePawns(team: bool, turn: bool, pawns: int, unmoved: int, occupancy: tuple, epSquare: None | int=None) -> dict:
+    """Find all possible moves of every pawn on one team at once.
+
+    Shift the whole bitboard of the team's pawns forwards to find every push, and shift the pushes of the unmoved pawns forwards again for the double moves.
+    The taking moves are found by shifting diagonally, after masking out any pawns on the edge file which would otherwise wrap around the board,
+    and if it is the team's turn, the square passed over by the last double move can be taken onto as well, as an en passant.
+    Each resulting destination is then handed back to the pawn it came from by stepping back along the shift.
+
+    Args:
+        team (bool): The team of the pawns whose moves are being checked.
+        turn (bool): The current turn in the game.
+        pawns (int): The bitboard of the squares of every pawn on the team.
+        unmoved (int): The bitboard of the squares of the pawns on the team which have never moved.
+        occupancy (tuple): The bitboards of the squares occupied by each team, indexed by team.
+
+    Kwargs:
+        epSquare (None | int) = None: The bitboard index of the square passed over by the last double move, if the last move was one.
+
+    Returns:
+        A dictionary of the bitboard of move destinations and the dictionary of special move flags, keyed by the bitboard index of each pawn.
+    """
+    empty = ~(occupancy[0] | occupancy[1]) & FULL_BOARD
+    targets = occupancy[not team]
+    if epSquare != None and team == turn:
+        targets |= 1 << epSquare
+
+    # An active pawn moves up the board, decreasing its index by a row, and an inactive one moves down it
+    forward = -8 if team == turn else 8
+    # Define an anonymous function to shift a bitboard by a signed number of squares, dropping any squares shifted off the board
+    shift = lambda bitboard, steps: (bitboard << steps) & FULL_BOARD if steps > 0 else bitboard >> -steps
+    pushes = shift(pawns, forward) & empty
+    doubles = shift(shift(unmoved, forward) & empty, forward) & empty
+    leftCaptures = shift(pawns & ~FILE_A, forward - 1) & targets
+    rightCaptures = shift(pawns & ~FILE_H, forward + 1) & targets
+
+    # Hand each destination back to the pawn which made it, by stepping back along the shift
+    sideMoves = {index: [0, {}] for index in iterBits(pawns)}
+    for target in iterBits(pushes):
+        sideMoves[target - forward][0] |= 1 << target
+    for target in iterBits(doubles):
+        sideMoves[target - 2 * forward][0] |= 1 << target
+        sideMoves[target - 2 * forward][1][target] = "d"
+    for target in iterBits(leftCaptures):
+        sideMoves[target - forward + 1][0] |= 1 << target
+    for target in iterBits(rightCaptures):
+        sideMoves[target - forward - 1][0] |= 1 << target
+
+    # Flag the en passant for whichever pawns can make it
+    if epSquare != None and team == turn:
+        for index in sideMoves:
+            if (sideMoves[index][0] >> epSquare) & 1:
+                sideMoves[index][1][epSquare] = "e"
+    return sideMoves
+
+@lru_cache(maxsize=_MOVE_CACHE_SIZE)
+def generateAllMoves(position: tuple, turn: bool) -> tuple:
+    """Find all possible moves of one team on a board of integer pieces.
+
+    The board tuple is itself the key of the cache, so a position which has been seen before, through an undo or a transposition in the search,
+    returns its moves without generating them again. The squares are read column by column, which keeps the move order the computer opponent relies on to break ties.
+
+    Args:
+        position (tuple): The flat board tuple, containing all integer pieces at their bitboard indices.
+        turn (bool): The team whose moves are being found, which is also the current turn.
+
+    Kwargs:
+        None
+
+    Returns:
+        A tuple of all possible moves, which is shared between calls so should not be modified.
+    """
+    allMoves = []
+    for x in range(8):
+        for y in range(8):
+            piece = position[y * 8 + x]
+            if piece != None and piece % 2 == turn:
+                if piece >= 10:
+                    allMoves += updateRegularMoves(turn, y * 8 + x, piece, PIECE_DIRECTIONS[piece // 10], position)
+                else:
+                    allMoves += updatePawnMoves(turn, turn, y * 8 + x, piece, position)
+    return tuple(allMoves)
+
+def kingAttacked(board: list, turn: bool) -> bool:
+    """Return whether any piece of the team whose turn it is could take the opposing king, on a board of integer pieces.
+
+    Rather than generating every move of the team and searching them for the king, as the VirtualBoard class did,
+    look outwards from each opposing king using the precomputed rays and attack tables to see whether a piece of the right type is there.
+    As in the integer move generation, the team whose turn it is is taken to be moving up the board, so its pawns attack diagonally upwards.
+
+    Args:
+        board (list): The flat board list, containing all integer pieces at their bitboard indices.
+        turn (bool): The team whose attacks are being checked.
+
+    Kwargs:
+        None
+
+    Returns:
+        Whether or not an opposing king is under attack.
+    """
+    # Build the occupied bitboard, the bitboards of each type of attacking piece, and the bitboard of opposing kings
+    occupied = 0
+    attackers = [0] * 6
+    kings = 0
+    for index, piece in enumerate(board):
+        if piece != None:
+            bit = 1 << index
+            occupied |= bit
+            if piece % 2 == turn:
+                attackers[piece // 10] |= bit
+            elif piece // 10 == 5:
+                kings |= bit
+
+    # A piece attacks the king exactly when the king, moving as that piece (or a pawn moving the opposite way), would attack it
+    for king in iterBits(kings):
+        if (slidingBitboard(king, 1, occupied) & (attackers[1] | attackers[4])
+                or slidingBitboard(king, 3, occupied) & (attackers[3] | attackers[4])
+                or KNIGHT_ATTACKS[king] & attackers[2]
+                or KING_ATTACKS[king] & attackers[5]
+                or PAWN_ATTACKS[False][king] & attackers[0]):
+            return True
+    return False
+
+def encodeBoard(board: list) -> list:
+    """Return a flat board list, indexed by bitboard index, of a board list of pieces with every piece encoded as an integer, for the integer move generation functions."""
+    return [None if (piece := board[index % 8][index // 8]) == None else piece.encodeInt() for index in range(64)]
+
+# The piece classes indexed by their values, which is built once so that decoding a piece does not create a new list each time
+PIECE_CLASSES: tuple = (Pawn, Rook, Knight, Bishop, Queen, King)
+
 # This is a static method instead of a piece method since this will be called when there is not yet any piece to call it.
 def decodeInt(code: int, square: pg.Vector2, squareSize: pg.Vector2) -> Piece:
     """Decode an integer representation of a piece back into that piece.
@@ -806,21 +1356,14 @@ def decodeInt(code: int, square: pg.Vector2, squareSize: pg.Vector2) -> Piece:
         Returns a copy of the original piece.
     """
     # Isolate the digits
-    value = code // 10
-    bools = code % 10
-
-    # Decode the booleans using division and modular arithmetic
-    team = bools % 2
-    movedEver = bool((bools - team) % 4)
-    doubleMoved = bools // 4
+    value, bools = divmod(code, 10)
 
-    # Depending on the value, create the piece
-    piece = [Pawn, Rook, Knight, Bishop, Queen, King][value](squareSize, square, team)
+    # Depending on the value, create the piece on the team given by the lowest bit
+    piece = PIECE_CLASSES[value](squareSize, square, bools & 1)
 
-    # Adjust with the decoded booleans, checking first if they are True since the default for them is False but they may not exist for that piece
-    if movedEver:
+    # Adjust with the moved ever bit, ignoring double moved since this is held by the board rather than the pawn
+    # This is checked first since the default is False but the attribute may not exist for that piece
+    if bools & MOVED_EVER_BIT:
         piece.movedEverTrue()
-    if doubleMoved:
-        piece.doubleMovedTrue()
 
     return piece
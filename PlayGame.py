@@ -15,8 +15,8 @@ Functions:
 
 # Import modules and libraries
 from loguru import logger
-import os
 import pygame as pg
+import queue
 import threading
 
 import Board as boa
@@ -40,6 +40,7 @@ class PlayGame:
 
     Public methods:
         getGameOver: Accessor method for the __gameOver attribute.
+        getDirtyRects: Accessor method for the __dirtyRects attribute.
         gameOverFalse: Mutator method for the __gameOver attribute to set it to False.
         setOpp: Mutator method for the __opponent attribute, and also change other aspects of the class to reflect the opponent.
         restart: Reset most attributes to their state at object instantiation, mostly resetting the class.
@@ -55,11 +56,12 @@ class PlayGame:
         __boardSize (pg.Vector2): The size of the board in pixels.
         __boardPos (pg.Vector2): The position of the board on the screen.
         __board (boa.Board): The board object, which stores the pieces and handles a lot of GUI and move logic.
-        __buttons (pg.sprite.Group): A sprite group for all of the buttons which will be displayed at the side of the screen.
+        __buttons (pg.sprite.RenderUpdates): A sprite group for all of the buttons which will be displayed at the side of the screen.
         __opponent (bool): True for a computer opponent and False for a human one.
         __negaMax (None | nMax.NegaMax): Either None if there is a human opponent, or the NegaMax object if there is a computer opponent, since it will be this which controls those moves.
         __negaMaxCalled (bool): Whether the __negaMax attribute's turn method has been called yet this turn.
-        __negaMaxThread (None | threading.Thread): Either None if there is a human opponent, or a Thread object to run the negamax algorithm in parallel with the main one.
+        __negaMaxJobs (queue.SimpleQueue): The queue of negamax turns waiting to be taken by the worker thread, with None signalling the worker to end.
+        __negaMaxWorker (None | threading.Thread): Either None if there is a human opponent, or the one long-lived Thread object which runs the negamax algorithm in parallel with the main one.
         __exitButton (inp.Button): The button which controls quitting the program.
         __restartButton (inp.button): The button which controls restarting the game.
         __surrenderButton (inp.Button): The button which allows a player to forfeit the game.
@@ -71,6 +73,8 @@ class PlayGame:
         __whiteDead (list): A list to store all dead pieces which used to be on the white team.
         __blackPieces (list): A list of the images of all black pieces.
         __blackDead (list): A list to store all dead pieces which used to be on the black team.
+        __deadLists (tuple): The white and black dead lists, indexed by team.
+        __promoImages (tuple): The idle, hovering and clicked images of the rook, knight, bishop and queen promotion buttons, for white and then black.
         __whiteCheck (pg.surface.Surface): The image displayed when the white king is in check.
         __blackCheck (pg.surface.Surface): The image displayed when the black king is in check.
         __whiteCheckmate (pg.surface.Surface): The image displayed when white is checkmated.
@@ -78,15 +82,42 @@ class PlayGame:
         __whiteWon (pg.surface.Surface): The image displayed when white wins due to black surrender.
         __blackWon (pg.surface.Surface): The image displayed when black wins due to white surrender.
         __stalemate (pg.Vector2): The image displayed when a stalemate occurs.
+        __checkImages (tuple): The check images, indexed by turn.
+        __winnerImages (tuple): The checkmate, stalemate and won images, indexed by winner.
+        __endgameImage (None | pg.surface.Surface): The cached background, message and board image displayed once the game has been won, or None if it has not been composed yet.
         __promotion (bool): Whether or not a promotion is currently being decided.
         __queen (None | inp.Button): A potential future button for selecting the queen when making a promotion.
         __bishop (None | inp.Button): A potential future button for selecting the bishop when making a promotion.
         __knight (None | inp.Button): A potential future button for selecting the knight when making a promotion.
         __rook (None | inp.Button): A potential future button for selecting the rook when making a promotion.
-        __promoButtons (pg.sprite.Group): A sprite group to hold all buttons displayed when offering options for a promotion.
+        __promoButtons (pg.sprite.RenderUpdates): A sprite group to hold all buttons displayed when offering options for a promotion.
+        __dirtyRects (list): The rects of the image which may have changed this frame.
+        __bgColours (tuple): The background colours, indexed by turn.
+        __bgTurn (None | bool): The turn whose colour the whole background was last filled with, or None if the whole image needs to be drawn again.
+        __fullRect (pg.Rect): The rect of the whole image.
+        __messageRect (pg.Rect): The rect above the board which holds the check message and the promotion buttons.
+        __deadRect (pg.Rect): The rect beside the board which holds the dead pieces.
+        __boardRect (pg.Rect): The rect of the board.
+        __messagePos (tuple): The position of the check and winner messages.
+        __winVersion (None | tuple): The board version, turn and turn swap for which the win conditions were last checked.
+        __lastInput (None | tuple): The mouse position and left mouse button state of the last frame.
+        __dirty (bool): Whether the image may still change even if the input is the same as the last frame's.
         __pastMoves (stk.Stack): The stack of all past move frames.
         __frame (fme.Frame): A frame of the current game state.
+        __zobristBoard (list): The virtual board list which was last hashed.
+        __zobristTurn (bool): The turn of the virtual board which was last hashed.
+        __zobrist (int): The Zobrist hash of the last hashed virtual board, which is passed to the negamax so that its transposition table can be used across turns.
     """
+
+    # Declare every attribute as a slot, so that they are stored without a per-instance dictionary and are quicker to access
+    __slots__: tuple = (
+        "__gameOver", "__gameWon", "__winner", "__size", "__image", "__turn", "__boardSize", "__boardPos", "__board", "__buttons", "__opponent", "__negaMax",
+        "__negaMaxCalled", "__negaMaxJobs", "__negaMaxWorker", "__exitButton", "__restartButton", "__surrenderButton", "__undoButton", "__readyButton",
+        "__timeButton", "__pieceSize", "__whitePieces", "__whiteDead", "__blackPieces", "__blackDead", "__deadLists", "__promoImages", "__whiteCheck", "__blackCheck",
+        "__whiteCheckmate", "__blackCheckmate", "__whiteWon", "__blackWon", "__stalemate", "__checkImages", "__winnerImages", "__endgameImage", "__promotion",
+        "__queen", "__bishop", "__knight", "__rook", "__promoButtons", "__dirtyRects", "__bgColours", "__bgTurn", "__fullRect", "__messageRect", "__deadRect",
+        "__boardRect", "__messagePos", "__winVersion", "__lastInput", "__dirty", "__pastMoves", "__frame", "__zobristBoard", "__zobristTurn", "__zobrist"
+    )
     
     # Initialise an object of this class when called
     def __init__(self, screenSize: pg.Vector2) -> None:
@@ -102,44 +133,27 @@ class PlayGame:
         self.__boardSize: pg.Vector2 = pg.Vector2(boardWidth, boardWidth)
         self.__boardPos: pg.Vector2 = pg.Vector2((self.__size - self.__boardSize) / 2)
         self.__board: boa.Board = boa.Board(self.__boardSize, self.__boardPos)
-        self.__buttons: pg.sprite.Group = pg.sprite.Group()
+        self.__buttons: pg.sprite.RenderUpdates = pg.sprite.RenderUpdates()
         self.__opponent: bool = False
         self.__negaMax: None | nMax.NegaMax = None
         self.__negaMaxCalled: bool = False
-        self.__negaMaxThread: None | threading.Thread = None
+        self.__negaMaxJobs: queue.SimpleQueue = queue.SimpleQueue()
+        self.__negaMaxWorker: None | threading.Thread = None
 
-        # Define the variables for changing the surfaces
+        # Define the sizes of the buttons
         buttonSize = (self.__size.elementwise() / pg.Vector2(4, 10))
-        buttonDarkener = pg.surface.Surface(buttonSize, pg.SRCALPHA)
-        buttonDarkener.fill((100, 100, 100))
 
         # Define the buttons
-        exitButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Exit Button.png").convert_alpha(), buttonSize)
-        exitButtonHovering = exitButtonIdle.copy()
-        exitButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-        exitButtonClicked = exitButtonHovering.copy()
-        exitButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+        exitButtonIdle, exitButtonHovering, exitButtonClicked = inp.loadButtonImages("Exit Button.png", tuple(buttonSize))
         self.__exitButton: inp.Button = inp.Button(buttonSize, (((self.__boardPos.x - buttonSize.x) / 2), self.__boardPos.y), exitButtonIdle, exitButtonHovering, exitButtonClicked)
         self.__buttons.add(self.__exitButton)
-        restartButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Restart Button.png").convert_alpha(), buttonSize)
-        restartButtonHovering = restartButtonIdle.copy()
-        restartButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-        restartButtonClicked = restartButtonHovering.copy()
-        restartButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+        restartButtonIdle, restartButtonHovering, restartButtonClicked = inp.loadButtonImages("Restart Button.png", tuple(buttonSize))
         self.__restartButton: inp.Button = inp.Button(buttonSize, (((self.__boardPos.x - buttonSize.x) / 2), (self.__boardPos.y + (buttonSize.y * 3/2))), restartButtonIdle, restartButtonHovering, restartButtonClicked)
         self.__buttons.add(self.__restartButton)
-        surrenderButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Surrender Button.png").convert_alpha(), buttonSize)
-        surrenderButtonHovering = surrenderButtonIdle.copy()
-        surrenderButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-        surrenderButtonClicked = surrenderButtonHovering.copy()
-        surrenderButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+        surrenderButtonIdle, surrenderButtonHovering, surrenderButtonClicked = inp.loadButtonImages("Surrender Button.png", tuple(buttonSize))
         self.__surrenderButton: inp.Button = inp.Button(buttonSize, (((self.__boardPos.x - buttonSize.x) / 2), (self.__boardPos.y + (buttonSize.y * 3))), surrenderButtonIdle, surrenderButtonHovering, surrenderButtonClicked)
         self.__buttons.add(self.__surrenderButton)
-        undoButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Undo Button.png").convert_alpha(), buttonSize)
-        undoButtonHovering = undoButtonIdle.copy()
-        undoButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-        undoButtonClicked = undoButtonHovering.copy()
-        undoButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+        undoButtonIdle, undoButtonHovering, undoButtonClicked = inp.loadButtonImages("Undo Button.png", tuple(buttonSize))
         self.__undoButton: inp.Button = inp.Button(buttonSize, (((self.__boardPos.x - buttonSize.x) / 2), (self.__boardPos.y + (buttonSize.y * 9/2))), undoButtonIdle, undoButtonHovering, undoButtonClicked)
         self.__buttons.add(self.__undoButton)
         self.__readyButton: None | inp.Button = None
@@ -147,40 +161,71 @@ class PlayGame:
 
         # Define piece-related attributes
         self.__pieceSize: pg.Vector2 = self.__boardSize / 8
-        self.__whitePieces: list = [pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\White Pawn.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\White Rook.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\White Knight.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\White Bishop.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\White Queen.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\White King.png").convert_alpha(), self.__pieceSize)]
+        self.__whitePieces: list = [inp.loadImage("White Pawn.png", tuple(self.__pieceSize)),
+                              inp.loadImage("White Rook.png", tuple(self.__pieceSize)),
+                              inp.loadImage("White Knight.png", tuple(self.__pieceSize)),
+                              inp.loadImage("White Bishop.png", tuple(self.__pieceSize)),
+                              inp.loadImage("White Queen.png", tuple(self.__pieceSize)),
+                              inp.loadImage("White King.png", tuple(self.__pieceSize))]
         self.__whiteDead: list = []
-        self.__blackPieces: list = [pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Black Pawn.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Black Rook.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Black Knight.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Black Bishop.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Black Queen.png").convert_alpha(), self.__pieceSize),
-                              pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Black King.png").convert_alpha(), self.__pieceSize)]
+        self.__blackPieces: list = [inp.loadImage("Black Pawn.png", tuple(self.__pieceSize)),
+                              inp.loadImage("Black Rook.png", tuple(self.__pieceSize)),
+                              inp.loadImage("Black Knight.png", tuple(self.__pieceSize)),
+                              inp.loadImage("Black Bishop.png", tuple(self.__pieceSize)),
+                              inp.loadImage("Black Queen.png", tuple(self.__pieceSize)),
+                              inp.loadImage("Black King.png", tuple(self.__pieceSize))]
         self.__blackDead: list = []
-        self.__whiteCheck: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\White Check!.png").convert_alpha(), buttonSize)
-        self.__blackCheck: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Black Check!.png").convert_alpha(), buttonSize)
-        self.__whiteCheckmate: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\White Checkmate!.png").convert_alpha(), buttonSize)
-        self.__blackCheckmate: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Black Checkmate!.png").convert_alpha(), buttonSize)
-        self.__whiteWon: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\White Won!.png").convert_alpha(), buttonSize)
-        self.__blackWon: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Black Won!.png").convert_alpha(), buttonSize)
-        self.__stalemate: pg.surface.Surface = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\Stalemate!.png").convert_alpha(), buttonSize)
+        # The dead lists are only ever changed in place, so this tuple always holds the current ones
+        self.__deadLists: tuple = (self.__whiteDead, self.__blackDead)
+        # The promotion button images are the same for every promotion, so create them for both colours only once
+        self.__promoImages: tuple = (self.__createPromoImages(self.__whitePieces), self.__createPromoImages(self.__blackPieces))
+        self.__whiteCheck: pg.surface.Surface = inp.loadImage("White Check!.png", tuple(buttonSize))
+        self.__blackCheck: pg.surface.Surface = inp.loadImage("Black Check!.png", tuple(buttonSize))
+        self.__whiteCheckmate: pg.surface.Surface = inp.loadImage("White Checkmate!.png", tuple(buttonSize))
+        self.__blackCheckmate: pg.surface.Surface = inp.loadImage("Black Checkmate!.png", tuple(buttonSize))
+        self.__whiteWon: pg.surface.Surface = inp.loadImage("White Won!.png", tuple(buttonSize))
+        self.__blackWon: pg.surface.Surface = inp.loadImage("Black Won!.png", tuple(buttonSize))
+        self.__stalemate: pg.surface.Surface = inp.loadImage("Stalemate!.png", tuple(buttonSize))
+        # Group the message images so that they can be indexed by turn or winner without building a list every frame
+        self.__checkImages: tuple = (self.__whiteCheck, self.__blackCheck)
+        self.__winnerImages: tuple = (self.__whiteCheckmate, self.__blackCheckmate, self.__stalemate, self.__whiteWon, self.__blackWon)
+        self.__endgameImage: None | pg.surface.Surface = None
         self.__promotion: bool = False
         self.__queen: None | inp.Button = None
         self.__bishop: None | inp.Button = None
         self.__knight: None | inp.Button = None
         self.__rook: None | inp.Button = None
-        self.__promoButtons: pg.sprite.Group = pg.sprite.Group()
+        self.__promoButtons: pg.sprite.RenderUpdates = pg.sprite.RenderUpdates()
+        self.__dirtyRects: list = []
+
+        # Define the background attributes, and the rects of the regions which are drawn again every frame, so that only they need to be cleared
+        # Each rect is made slightly larger than its region so that no pixel is missed when the positions are rounded
+        self.__bgColours: tuple = ("grey80", "grey20")
+        self.__bgTurn: None | bool = None
+        self.__fullRect: pg.Rect = self.__image.get_rect()
+        self.__messagePos: tuple = ((self.__size.x * 3/8), ((self.__boardPos.y - (self.__size.y / 10)) / 2))
+        messageRect = pg.Rect(self.__messagePos, buttonSize)
+        promoRect = pg.Rect(self.__boardPos.x + 2 * self.__pieceSize.x, self.__boardPos.y - self.__pieceSize.y, 4 * self.__pieceSize.x, self.__pieceSize.y)
+        self.__messageRect: pg.Rect = messageRect.union(promoRect).inflate(2, 2)
+        self.__deadRect: pg.Rect = pg.Rect(self.__boardPos.x + self.__boardSize.x, self.__boardPos.y, 4 * self.__pieceSize.x, 8 * self.__pieceSize.y).inflate(2, 2)
+        self.__boardRect: pg.Rect = pg.Rect(self.__boardPos, self.__boardSize).inflate(2, 2)
+        self.__winVersion: None | tuple = None
+        self.__lastInput: None | tuple = None
+        self.__dirty: bool = True
         self.__pastMoves: stk.Stack = stk.Stack(20)
         self.__frame: fme.Frame = self.__createFrame()
+        self.__zobristBoard: list = self.__board.createVBoard(False).getBoard()
+        self.__zobristTurn: bool = False
+        self.__zobrist: int = nMax.zobristHash(self.__zobristBoard, False)
 
     def getGameOver(self) -> bool:
         """Return the game over attribute."""
         return self.__gameOver
     
+    def getDirtyRects(self) -> list:
+        """Return the dirty rects attribute."""
+        return self.__dirtyRects
+
     def gameOverFalse(self) -> None:
         """Set the game over attribute to False."""
         self.__gameOver = False
@@ -188,32 +233,35 @@ class PlayGame:
     def setOpp(self, opponent: bool) -> None:
         """Set the opponent attribute and make the necessary changes to reflect this setting."""
         self.__opponent = opponent
+        self.__dirty = True
         # If there is a computer opponent, create the minimax and add buttons for having it move when ready or when the buffer time elapses
         if self.__opponent:
-            self.__negaMax = nMax.NegaMax()
+            # Keep any existing negamax so that its transposition table stays warm
+            if self.__negaMax == None:
+                self.__negaMax = nMax.NegaMax()
+            else:
+                self.__negaMax.reset()
+            # Make this a daemon thread, so that if somehow the main thread finishes, the worker will automatically end, since the game would be over so there would be no point in its continued existence
+            if self.__negaMaxWorker == None:
+                self.__negaMaxWorker = threading.Thread(target=self.__negaMaxWork, daemon=True)
+                self.__negaMaxWorker.start()
 
-            # Define the variables for changing the surfaces
+            # Define the sizes of the buttons
             buttonSize = (self.__size.elementwise() / pg.Vector2(4, 10))
-            buttonDarkener = pg.surface.Surface(buttonSize, pg.SRCALPHA)
-            buttonDarkener.fill((100, 100, 100))
 
             # Define the buttons
-            readyButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\AI Ready Button.png").convert_alpha(), buttonSize)
-            readyButtonHovering = readyButtonIdle.copy()
-            readyButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-            readyButtonClicked = readyButtonHovering.copy()
-            readyButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+            readyButtonIdle, readyButtonHovering, readyButtonClicked = inp.loadButtonImages("AI Ready Button.png", tuple(buttonSize))
             self.__readyButton: inp.Button = inp.Button(buttonSize, (((self.__boardPos.x - buttonSize.x) / 2), (self.__boardPos.y + (buttonSize.y * 6))), readyButtonIdle, readyButtonHovering, readyButtonClicked)
             self.__buttons.add(self.__readyButton)
-            timeButtonIdle = pg.transform.scale(pg.image.load(os.path.dirname(os.path.abspath(__file__)) + "\\Assets\\AI Time Button.png").convert_alpha(), buttonSize)
-            timeButtonHovering = timeButtonIdle.copy()
-            timeButtonHovering.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
-            timeButtonClicked = timeButtonHovering.copy()
-            timeButtonClicked.blit(buttonDarkener, pg.Vector2(0, 0), special_flags=pg.BLEND_MULT)
+            timeButtonIdle, timeButtonHovering, timeButtonClicked = inp.loadButtonImages("AI Time Button.png", tuple(buttonSize))
             self.__timeButton: inp.Button = inp.Button(buttonSize, (((self.__boardPos.x - buttonSize.x) / 2), (self.__boardPos.y + (buttonSize.y * 6))), timeButtonIdle, timeButtonHovering, timeButtonClicked)
 
         else:
             self.__negaMax = None
+            # Signal the worker to end, as it is no longer needed
+            if self.__negaMaxWorker != None:
+                self.__negaMaxJobs.put(None)
+                self.__negaMaxWorker = None
             if self.__readyButton != None:
                 self.__readyButton.kill()
             if self.__timeButton != None:
@@ -222,61 +270,94 @@ class PlayGame:
     def __createFrame(self) -> fme.Frame:
         """Create a frame object, to be used to facilitate the undo functionality, to store a previous game state."""
         # Take copies of the dead lists otherwise they will change since they are only going to be stored as pointers
-        return fme.Frame(self.__board.createVBoard(self.__turn), [self.__whiteDead.copy(), self.__blackDead.copy()])
+        return fme.Frame(self.__board.createSnapshot(), [self.__whiteDead.copy(), self.__blackDead.copy()])
+
+    def __negaMaxWork(self) -> None:
+        """Take negamax turns from the jobs queue until signalled to end, so that a new thread is not needed for every turn."""
+        while True:
+            job = self.__negaMaxJobs.get()
+            # Only the most recent job matters, since any older one is of a board state which has since changed
+            while job != None and not self.__negaMaxJobs.empty():
+                job = self.__negaMaxJobs.get()
+            if job == None:
+                return
+            takeTurn, args, kwargs = job
+            # Use a try-except clause so that a failed turn is only logged, since this is the only worker and the computer would otherwise never move again
+            try:
+                takeTurn(*args, **kwargs)
+            except Exception:
+                logger.exception("NegaMax turn failed")
+
+    def __queueNegaMax(self) -> None:
+        """Queue a negamax turn of the current position for the worker thread."""
+        self.__negaMaxJobs.put((self.__negaMax.takeTurn, (self.__boardPos, self.__pieceSize, self.__createVBoard()), {"zobrist": self.__zobrist}))
+
+    def __createVBoard(self) -> boa.VirtualBoard:
+        """Create a virtual board of the current position for the negamax, and update the Zobrist hash to match it."""
+        vBoard = self.__board.createVBoard(self.__turn)
+        boardList = vBoard.getBoard()
+
+        # Rather than hashing from scratch, only XOR the keys of the squares which have changed since the last hash, whether by moves, promotions or undos
+        self.__zobrist = nMax.updateZobrist(self.__zobrist, self.__zobristBoard, self.__zobristTurn, boardList, self.__turn)
+        self.__zobristBoard = boardList
+        self.__zobristTurn = self.__turn
+        return vBoard
 
     def __setFrame(self, frame: None | fme.Frame) -> None:
         """Change the current board state to reflect a board frame."""
         if frame != None:
-            [self.__whiteDead, self.__blackDead] = frame.getDead()
-            
-            # Decode the pieces back into objects, adding them to their sprite groups
-            pieces = pg.sprite.Group()
-            kings = pg.sprite.Group()
-            # Decode every value on the board which is not none and add them all to the pieces sprite group, while using an or statement for a secondary selection to identify the kings and add them to the kings sprite group
-            [pieces.add(pieceObj) for x, column in enumerate(frame.getBoard().getBoard()) for y, pieceInt in enumerate(column) if pieceInt != None and (pieceObj := pie.decodeInt(pieceInt, pg.Vector2(x, y), self.__board.getSquareSize())) and ((not isinstance(pieceObj, pie.King)) or kings.add(pieceObj) == None)]
-
-            # Create the board
-            board = [[None] * 8 for y in range(8)]
-            for piece in pieces:
-                square = piece.getSquare()
-                board[int(square[0])][int(square[1])] = piece
-
-            # Replace the board's sprite groups and board list with the new ones
-            self.__board.setBoard(board)
-            self.__board.setPieces(pieces)
-            self.__board.setKings(kings)
+            self.__whiteDead[:], self.__blackDead[:] = frame.getDead()
+
+            # Put the pieces of the frame back into their saved states, rather than decoding every piece into a new object
+            self.__board.restoreSnapshot(frame.getSnapshot())
 
     def restart(self) -> None:
         """Reset most aspects of the object so that the game can be played fresh with nothing gameplay-wise carrying over from last time."""
         logger.info("PlayGame restarting")
-        boardWidth = self.__size.y * 2 / 3
-        self.__boardSize = pg.Vector2(boardWidth, boardWidth)
-        self.__board = boa.Board(self.__boardSize, self.__boardPos)
+        # Reuse the board, stack and negamax rather than creating them again
+        self.__board.reset()
         self.__turn = False
         self.__gameOver = False
         self.__gameWon = False
         self.__winner = None
-        self.__whiteDead = []
-        self.__blackDead = []
+        self.__endgameImage = None
+        self.__bgTurn = None
+        self.__dirty = True
+        self.__whiteDead.clear()
+        self.__blackDead.clear()
         self.__promotion = False
-        self.__promoButtons = pg.sprite.Group()
+        self.__promoButtons.empty()
         self.__frame = self.__createFrame()
-        self.__pastMoves = stk.Stack(20)
+        self.__pastMoves.clear()
+        self.__zobristBoard = self.__board.createVBoard(False).getBoard()
+        self.__zobristTurn = False
+        self.__zobrist = nMax.zobristHash(self.__zobristBoard, False)
         self.__negaMaxCalled = False
         if self.__opponent:
-            self.__negaMax.stopThinking()
-            self.__negaMax = nMax.NegaMax()
+            self.__negaMax.reset()
         else:
             self.__negaMax = None
         
-    def __wonGame(self, events: list) -> None:
+    def __wonGame(self, events: inp.EventBundle) -> None:
         """If the game has been won and a click occurs, signifying the player's intent to move on, the __gameOver attribute is set to True."""
-        self.__image.blit([self.__whiteCheckmate, self.__blackCheckmate, self.__stalemate, self.__whiteWon, self.__blackWon][self.__winner], pg.Vector2((self.__size.x * 3/8), ((self.__boardPos.y - (self.__size.y / 10)) / 2)))
-        self.__image.blit(self.__board.getImage(), self.__boardPos)
-        if [None for event in events if event.type == pg.MOUSEBUTTONUP and event.button == pg.BUTTON_LEFT]:
+        # Nothing on the board or background changes until the game is replayed, so compose the end of game image once and draw it in full only then
+        if self.__endgameImage == None:
+            self.__endgameImage = pg.surface.Surface(self.__size)
+            self.__endgameImage.fill(self.__bgColours[self.__turn])
+            self.__endgameImage.blit(self.__winnerImages[self.__winner], self.__messagePos)
+            self.__endgameImage.blit(self.__board.getImage(), self.__boardPos)
+            self.__image.blit(self.__endgameImage, (0, 0))
+            self.__dirtyRects.append(self.__fullRect)
+
+        # Otherwise, only restore the parts of the end of game image which the buttons and dead pieces are drawn over every frame
+        else:
+            self.__buttons.clear(self.__image, self.__endgameImage)
+            self.__image.blit(self.__endgameImage, self.__deadRect, self.__deadRect)
+            self.__dirtyRects.append(self.__deadRect)
+        if events.getLeftUp():
             self.__gameOver = True
         
-    def __updateButtons(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
+    def __updateButtons(self, events: inp.EventBundle, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
         """Update the buttons on the side of the screen, executing all of their intended functions if they were pressed.
         
         Go through every button at the side of the screen, doing the following upon each one's being pressed:
@@ -288,7 +369,7 @@ class PlayGame:
         - Time: only run if __opponent is True, set the negamax rules of engagement to weapons tight (between 3-10 seconds) and swap displayed button.
 
         Args:
-            events (list): The current frame's events queue.
+            events (inp.EventBundle): The current frame's classified events.
             mousePos (pg.Vector2): The current position of the mouse.
             leftMousePressed (bool): Whether or not the left mouse button is currently being pressed.
 
@@ -301,24 +382,27 @@ class PlayGame:
         # Update and display the buttons
         self.__buttons.update(events, mousePos, leftMousePressed)
 
+        # A button can only become pressed upon the left mouse button being released, so on any other frame none of them need checking
+        released = events.getLeftUp()
+
         # Quit the game if the exit button is pressed
-        if self.__exitButton.getPressed():
+        if released and self.__exitButton.getPressed():
             quit("Thanks for playing!")
 
         # Restart the game and board if the restart button is pressed
-        if self.__restartButton.getPressed():
+        if released and self.__restartButton.getPressed():
             self.restart()
             self.__restartButton.pressedFalse()
 
         # End the game and set the winner as the opposing player if the surrender button is pressed
-        if self.__surrenderButton.getPressed():
+        if released and self.__surrenderButton.getPressed():
             self.__gameWon = True
             self.__winner = (not self.__turn) + 3
-            logger.success(f"{["White", "Black"][not self.__turn]} player won by opponent surrender!")
+            logger.success("{} player won by opponent surrender!", pie.TEAM_NAMES[not self.__turn])
             self.__surrenderButton.pressedFalse()
 
         # Set the game to the previous state if the undo button is pressed
-        if self.__undoButton.getPressed():
+        if released and self.__undoButton.getPressed():
             if not self.__pastMoves.isEmpty():
                 logger.success("Move undone!")
 
@@ -332,6 +416,8 @@ class PlayGame:
                     self.__gameOver = False
                     self.__gameWon = False
                     self.__winner = None
+                    self.__endgameImage = None
+                    self.__bgTurn = None
 
                 else:
                     # Do not swap the turn if the game was already won since this would have happened automatically
@@ -344,12 +430,9 @@ class PlayGame:
                     # If there is a computer opponent and it is black's turn, run the negamax algorithm, and otherwise reset the called attribute
                     if self.__opponent:
                         if self.__turn and not self.__negaMaxCalled:
-                            if self.__negaMax != None and self.__negaMaxThread.is_alive():
-                                self.__negaMax.stopThinking()
-                            vBoard = self.__board.createVBoard(self.__turn)
-                            # Make this a daemon thread, so that if somehow the main thread finishes, the negaMax thread will automatically end, since the game would be over so there would be no point in its continued existence
-                            self.__negaMaxThread = threading.Thread(target=self.__negaMax.takeTurn, args=(self.__boardPos, self.__pieceSize, vBoard), daemon=True)
-                            self.__negaMaxThread.start()
+                            # Stop any search of the undone position before queueing one of the current position
+                            self.__negaMax.stopThinking()
+                            self.__queueNegaMax()
                         else:
                             self.__negaMaxCalled = False
                             self.__negaMax.stopThinking()
@@ -358,10 +441,10 @@ class PlayGame:
                 self.__frame = self.__createFrame()
                 self.__board.updateMoves(self.__turn)
             self.__undoButton.pressedFalse()
-        self.__buttons.draw(self.__image)
+        self.__dirtyRects += self.__buttons.draw(self.__image)
 
         # Change the ROE and swap buttons based on whichever of the AI type buttons were pressed
-        if self.__opponent:
+        if self.__opponent and released:
             if self.__readyButton.getPressed():
                 self.__buttons.add(self.__timeButton)
                 self.__negaMax.weaponsFree()
@@ -386,10 +469,24 @@ class PlayGame:
                 imageLists = [self.__blackPieces, self.__whitePieces]
 
             # Iterate through all pieces on both dead lists and, using the turn, calculate which pieces to display where, displaying them in rows of 4 with the opponent's pieces at the top and friendly pieces at the bottom
-            [[self.__image.blit(imageLists[y][piece], (self.__boardPos + pg.Vector2((self.__boardSize.x + (self.__pieceSize.x * (x % 4))), (((x // 4) + (y * 4)) * self.__pieceSize.y)))) for x, piece in enumerate(colourDead)] for y, colourDead in enumerate(deadLists)]
+            # The positions are worked out with plain numbers and collected into one sequence, so that every piece is drawn in a single blits call
+            startX = self.__boardPos.x + self.__boardSize.x
+            startY = self.__boardPos.y
+            pieceWidth, pieceHeight = self.__pieceSize
+            blitSequence = []
+            for y, colourDead in enumerate(deadLists):
+                for x, piece in enumerate(colourDead):
+                    blitSequence.append((imageLists[y][piece], (startX + (pieceWidth * (x % 4)), startY + (((x // 4) + (y * 4)) * pieceHeight))))
+            self.__image.blits(blitSequence, doreturn=False)
 
     def __winConditions(self, swapTurn: bool=False) -> None:
-        """Check if there is either a checkmate or a stalemate, and carry out the appropriate procedures for each."""
+        """Check if there is either a checkmate or a stalemate, and carry out the appropriate procedures for each, unless nothing has changed since the last check."""
+        # Neither can have changed if the board, its moves and the turn are all the same as last time, which is the case on every frame of a promotion but the first
+        winVersion = (self.__board.getVersion(), self.__turn, swapTurn)
+        if winVersion == self.__winVersion:
+            return
+        self.__winVersion = winVersion
+
         # Check if the promotion caused a game over, and swap the parameter if swapTurn is True (i.e. take the XOR of both)
         if self.__board.getCheckmate(not (self.__turn ^ swapTurn)):
             self.__gameWon = True
@@ -399,7 +496,7 @@ class PlayGame:
             # Change the turn to show the correct-coloured background if the turn is to be swapped
                 self.__turn = not self.__turn
             self.__winner = self.__turn
-            logger.success(f"{["White", "Black"][self.__turn]} player won by checkmate!")
+            logger.success("{} player won by checkmate!", pie.TEAM_NAMES[self.__turn])
 
         elif self.__board.getStalemate(self.__turn ^ swapTurn):
             self.__gameWon = True
@@ -408,10 +505,24 @@ class PlayGame:
             self.__winner = 2
             logger.success("The game ended by stalemate!")
 
+    def __createPromoImages(self, pieceImages: list) -> list:
+        """Return the idle, hovering and clicked images of the rook, knight, bishop and queen promotion buttons, given the piece images of one colour."""
+        # Create the image filter
+        colourFilter = pg.surface.Surface(self.__pieceSize, pg.SRCALPHA)
+        colourFilter.fill((191, 161, 0, 50))
+        promoImages = []
+        for idle in pieceImages[1:5]:
+            hovering = idle.copy()
+            hovering.blit(colourFilter, (0, 0))
+            clicked = hovering.copy()
+            clicked.blit(colourFilter, (0, 0))
+            promoImages.append((idle, hovering, clicked))
+        return promoImages
+
     def __foundPromo(self) -> None:
         """If there has just been a promotion, change __promotion and generate the promotion buttons.
         
-        Depending on the turn, create buttons of each piece other than pawns and kings for either colour,
+        Depending on the turn, take the premade images of each piece other than pawns and kings for either colour,
         and then create buttons based on each of these images, adding them to the __promoButtons sprite group.
 
         Args:
@@ -424,40 +535,32 @@ class PlayGame:
             None
         """
         self.__promotion = True
-        # Create the promotion buttons
-        if self.__turn:
-            images = [self.__blackPieces[i] for i in range(1, 5)]
-        else:
-            images = [self.__whitePieces[i] for i in range(1, 5)]
-
-        # Create the image filters
-        colourFilter = pg.surface.Surface(self.__pieceSize, pg.SRCALPHA)
-        colourFilter.fill((191, 161, 0, 50))
-        hoveringImages = [image.copy() for image in images]
-        [image.blit(colourFilter, (0, 0)) for image in hoveringImages]
-        clickedImages = [image.copy() for image in hoveringImages]
-        [image.blit(colourFilter, (0, 0)) for image in clickedImages]
+        # Get the promotion button images of the current colour
+        images = self.__promoImages[self.__turn]
 
         # Go through all promotion buttons and add them to the __promoButtons Group (this is done the long way since it requires attributes to be changed as well, so iteration over a list would not work)
-        offset = self.__boardPos + pg.Vector2(2 * self.__pieceSize.x, -self.__pieceSize.y)
-        self.__queen = inp.Button(self.__pieceSize, offset, images[3], hoveringImages[3], clickedImages[3])
+        # The positions are worked out with plain numbers, since the buttons accept tuples just as well as vectors
+        pieceWidth, pieceHeight = self.__pieceSize
+        offsetX = self.__boardPos.x + 2 * pieceWidth
+        offsetY = self.__boardPos.y - pieceHeight
+        self.__queen = inp.Button(self.__pieceSize, (offsetX, offsetY), *images[3])
         self.__promoButtons.add(self.__queen)
-        self.__bishop = inp.Button(self.__pieceSize, (offset + pg.Vector2(self.__pieceSize.x, 0)), images[2], hoveringImages[2], clickedImages[2])
+        self.__bishop = inp.Button(self.__pieceSize, (offsetX + pieceWidth, offsetY), *images[2])
         self.__promoButtons.add(self.__bishop)
-        self.__knight = inp.Button(self.__pieceSize, (offset + pg.Vector2(2 * self.__pieceSize.x, 0)), images[1], hoveringImages[1], clickedImages[1])
+        self.__knight = inp.Button(self.__pieceSize, (offsetX + 2 * pieceWidth, offsetY), *images[1])
         self.__promoButtons.add(self.__knight)
-        self.__rook = inp.Button(self.__pieceSize, (offset + pg.Vector2(3 * self.__pieceSize.x, 0)), images[0], hoveringImages[0], clickedImages[0])
+        self.__rook = inp.Button(self.__pieceSize, (offsetX + 3 * pieceWidth, offsetY), *images[0])
         self.__promoButtons.add(self.__rook)
 
     # Define a method to handle a current promotion
-    def __currentPromo(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
+    def __currentPromo(self, events: inp.EventBundle, mousePos: pg.Vector2, leftMousePressed: bool) -> None:
         """Handle a current promotion.
         
         Update the promotion buttons to get which piece the pawn will be promoted to,
         before then manually calling the board's move swap methods for it since the typical way of swapping moves has been skipped.
 
         Args:
-            events (list): The current frame's events queue.
+            events (inp.EventBundle): The current frame's classified events.
             mousePos (pg.Vector2): The current position of the mouse.
             leftMousePressed (bool): Whether or not the left mouse button is currently being pressed.
 
@@ -468,58 +571,55 @@ class PlayGame:
             None
         """
         # Go through every piece, checking for promotion
+        # A button can only become pressed upon the left mouse button being released, so on any other frame none of them need checking
         promoted = False
         self.__promoButtons.update(events, mousePos, leftMousePressed)
-        if self.__queen.getPressed():
-            promoted = True
-            value = 0
-        elif self.__bishop.getPressed():
-            promoted = True
-            value = 1
-        elif self.__knight.getPressed():
-            promoted = True
-            value = 2
-        elif self.__rook.getPressed():
-            promoted = True
-            value = 3
+        if events.getLeftUp():
+            for buttonValue, button in enumerate((self.__queen, self.__bishop, self.__knight, self.__rook)):
+                if button.getPressed():
+                    promoted = True
+                    value = buttonValue
+                    break
 
         # If a promotion occurred, change attributes and update the board
         if promoted:
             self.__promotion = False
             self.__board.promoteTo(value)
             self.__board.toPromoteNone()
+
+            # Handle anything which the board class would have handled had the move progressed normally, only updating the moves once the board has been rotated
+            self.__turn = not self.__turn
+            self.__board.rotateBoard()
             self.__board.updateMoves(self.__turn)
 
-            # Check for game won
-            self.__winConditions()
+            # Check if the promotion caused a game over, which swaps the turn back if so
+            self.__winConditions(True)
 
-            # If not, handle anything which the board class would have handled had the move progressed normally, as well as handling check
             if not self.__gameWon:
-                self.__turn = not self.__turn
-                self.__board.rotateBoard()
-                self.__board.updateMoves(self.__turn)
-
                 # If there is a computer opponent and it is black's turn, run the negamax algorithm, and otherwise reset the called attribute
                 if self.__opponent:
                     if self.__turn and not self.__negaMaxCalled:
-                        # Make this a daemon thread, so that if somehow the main thread finishes, the negaMax thread will automatically end, since the game would be over so there would be no point in its continued existence
-                        self.__negaMaxThread = threading.Thread(target=self.__negaMax.takeTurn, args=(self.__boardPos, self.__pieceSize, self.__board.createVBoard(self.__turn)), daemon=True)
-                        self.__negaMaxThread.start()
+                        self.__queueNegaMax()
                     else:
                         self.__negaMaxCalled = False
 
-        self.__promoButtons.draw(self.__image)
-        self.__image.blit(self.__board.update(self.__turn, events, mousePos, leftMousePressed), self.__boardPos)
+        self.__dirtyRects += self.__promoButtons.draw(self.__image)
+
+        # The board ignores all input until a promotion is chosen, so until then its last image is drawn again rather than being drawn anew
+        if promoted:
+            self.__image.blit(self.__board.update(self.__turn, events, mousePos, leftMousePressed), self.__boardPos)
+        else:
+            self.__image.blit(self.__board.getImage(), self.__boardPos)
 
     # Define a method to update the game
-    def update(self, events: list, mousePos: pg.Vector2, leftMousePressed: bool) -> pg.surface.Surface:
+    def update(self, events: inp.EventBundle, mousePos: pg.Vector2, leftMousePressed: bool) -> pg.surface.Surface:
         """Process the user inputs, make the necessary changes to the game logic, and create and return the screen image.
         
         Decide on background colour, before checking if the game is over, and then finally if not,
         update the board and use this to update both the image and the logic.
 
         Args:
-            events (list): The current frame's events queue.
+            events (inp.EventBundle): The current frame's classified events.
             mousePos (pg.Vector2): The current position of the mouse.
             leftMousePressed (bool): Whether or not the left mouse button is currently being pressed.
 
@@ -529,11 +629,34 @@ class PlayGame:
         Returns:
             The screen image that will be displayed by this object.
         """
-        # Depending on whose turn it is, fill the image with their respecive colour
-        if self.__turn:
-            self.__image.fill("grey20")
-        else:
-            self.__image.fill("grey80")
+        # Start a fresh list of the rects drawn onto this frame
+        self.__dirtyRects = []
+
+        # The image only changes in response to input, so once a frame has been drawn with no left mouse button events and the same mouse as the one before it, nothing is left to change
+        # Until there is new input, the image is returned as it is with no rects drawn
+        frameInput = (tuple(mousePos), leftMousePressed)
+        changed = frameInput != self.__lastInput or events.getLeftEvents() != ()
+        if not (changed or self.__dirty):
+            return self.__image
+        self.__dirty = changed
+        self.__lastInput = frameInput
+
+        # Depending on whose turn it is, fill the image with their respecive colour, unless the game has been won, since the end of game image is used instead
+        # The whole image is only filled when the colour has changed, and otherwise only the regions which are drawn again every frame are cleared
+        if not self.__gameWon:
+            colour = self.__bgColours[self.__turn]
+            if self.__bgTurn != self.__turn:
+                self.__image.fill(colour)
+                self.__bgTurn = self.__turn
+                self.__dirtyRects.append(self.__fullRect)
+                self.__dirty = True
+            else:
+                clearRect = lambda surface, rect: surface.fill(colour, rect)
+                self.__buttons.clear(self.__image, clearRect)
+                self.__promoButtons.clear(self.__image, clearRect)
+                self.__image.fill(colour, self.__messageRect)
+                self.__image.fill(colour, self.__deadRect)
+                self.__dirtyRects += [self.__messageRect, self.__deadRect, self.__boardRect]
 
         # If the game has been won, a different process will take place
         if self.__gameWon:
@@ -541,8 +664,6 @@ class PlayGame:
 
         elif self.__promotion:
             self.__currentPromo(events, mousePos, leftMousePressed)
-            # Check if the promotion caused a game over
-            self.__winConditions(True)
 
         else:
             # Update the board and display it onto the game image
@@ -562,14 +683,10 @@ class PlayGame:
 
                 # Handle any dead pieces created this turn
                 dead = self.__board.getDead()
-                if dead != None:
-                    # If there is a list of dead, iterate through it
-                    if not isinstance(dead, list):
-                        [self.__whiteDead, self.__blackDead][dead[0]].append(dead[1])
-                        self.__board.deadNone()
-                    else:
-                        [[self.__whiteDead, self.__blackDead][singleDead[0]].append(singleDead[1]) for singleDead in dead]
-                        self.__board.deadNone()
+                if dead:
+                    for team, value in dead:
+                        self.__deadLists[team].append(value)
+                    self.__board.deadEmpty()
 
                 # Add the old frame to the past moves stack and create a new one
                 self.__pastMoves.push(self.__frame)
@@ -578,9 +695,7 @@ class PlayGame:
                 # If there is a computer opponent and it is black's turn, run the negamax algorithm, and otherwise reset the called attribute
                 if self.__opponent:
                     if self.__turn and not self.__negaMaxCalled:
-                        # Make this a daemon thread, so that if somehow the main thread finishes, the negaMax thread will automatically end, since the game would be over so there would be no point in its continued existence
-                        self.__negaMaxThread = threading.Thread(target=self.__negaMax.takeTurn, args=(self.__boardPos, self.__pieceSize, self.__board.createVBoard(self.__turn)), daemon=True)
-                        self.__negaMaxThread.start()
+                        self.__queueNegaMax()
                     else:
                         self.__negaMax.stopThinking()
                         self.__negaMaxCalled = False
@@ -589,7 +704,7 @@ class PlayGame:
         
         # Display the check message if necessary
         if self.__board.getCheck(self.__turn) and not self.__gameWon:
-            self.__image.blit([self.__whiteCheck, self.__blackCheck][self.__turn], pg.Vector2((self.__size.x * 3/8), ((self.__boardPos.y - (self.__size.y / 10)) / 2)))
+            self.__image.blit(self.__checkImages[self.__turn], self.__messagePos)
 
         self.__updateButtons(events, mousePos, leftMousePressed)
         self.__displayDead()
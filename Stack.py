@@ -12,6 +12,7 @@ Functions:
 """
 
 # Import modules and libraries
+from collections import deque
 from loguru import logger
 
 import Frame as fme
@@ -36,30 +37,36 @@ class Stack:
         push: Append an entity to the stack, removing any entities from the bottom where necessary.
         peek: Return the entity at the top of the stack.
         pop: Delete and return the entity at the top of the stack.
+        clear: Remove every entity from the stack.
 
     Attributes:
         __maxSize (int): The maximum size of the stack.
-        __list (list): The list of previous gamestate frames.
+        __list (deque): The deque of previous gamestate frames, bounded to the maximum size.
     """
+
+    # Declare the attributes as slots, since the stack is pushed to on every move and popped from on every undo
+    __slots__: tuple = ("__maxSize", "__list")
     
     # Initialise an object of this class when called
     def __init__(self, maxSize: int):
         logger.info("Stack created")
         # Define attributes
         self.__maxSize: int = maxSize
-        self.__list: list = []
+        # A bounded deque drops its oldest entity by itself when appended to at maximum size, without shifting the rest
+        self.__list: deque = deque(maxlen=maxSize)
 
     def getMaxSize(self) -> int:
         """Return the __maxSize attribute."""
         return self.__maxSize
     
     def setMaxSize(self, newMaxSize: int) -> None:
-        """Set the __maxSize attribute."""
+        """Set the __maxSize attribute, rebuilding the deque with the new bound so that only the newest entities are kept."""
         self.__maxSize = newMaxSize
+        self.__list = deque(self.__list, maxlen=newMaxSize)
     
     def getList(self) -> list:
-        """Return the __list attribute."""
-        return self.__list
+        """Return the __list attribute as a list."""
+        return list(self.__list)
     
     def isEmpty(self) -> bool:
         """Return whether the __list attribute is empty."""
@@ -70,12 +77,9 @@ class Stack:
         return len(self.__list) == self.__maxSize
     
     def push(self, newItem) -> None:
-        """Append an entity to the stack."""
+        """Append an entity to the stack, which removes the oldest entity if the stack is full."""
         logger.debug("Pushed to stack")
         self.__list.append(newItem)
-        if len(self.__list) > self.__maxSize:
-            while len(self.__list) != self.__maxSize:
-                del(self.__list[0])
 
     def peek(self) -> None | fme.Frame:
         """Return the entity at the top of the stack."""
@@ -87,4 +91,9 @@ class Stack:
         logger.debug("Popped from stack")
         if len(self.__list) != 0:
             return self.__list.pop()
+
+    def clear(self) -> None:
+        """Remove every entity from the stack."""
+        logger.debug("Stack cleared")
+        self.__list.clear()
     
\ No newline at end of file
@@ -25,6 +25,7 @@ import sys
 import time
 
 import Game as gam
+import Input as inp
 
 # Start pygame and set up video and window settings
 pg.init()
@@ -38,9 +39,10 @@ if not os.path.exists("Logs"):
     os.makedirs("Logs")
 # Only log info to file
 logger.remove()
-# Format the logs
-logger.add("Logs/Chess_{time}.log", format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}", level=["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"][logLevel])
-logger.add(sys.stdout, colorize=True, format="<green>{time}</green> <level>{message}</level>")
+# Format the logs, sending only those at or above the log level to either sink, so that loguru discards any below it before they are formatted
+levelName = ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")[logLevel]
+logger.add("Logs/Chess_{time}.log", format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}", level=levelName)
+logger.add(sys.stdout, colorize=True, format="<green>{time}</green> <level>{message}</level>", level=levelName)
 logger.info("Running Chess")
 # Get the path of the directory this program is in
 dirPath = os.path.dirname(os.path.abspath(__file__))
@@ -49,18 +51,19 @@ logger.debug(dirPath)
 goalDir = os.path.join(dirPath,"Logs")
 
 logger.debug(os.path.abspath(goalDir))
-# Iterate through all the files in the goal directory
-for file in os.listdir(goalDir):
-    if file.endswith(".log"):
+# Get the current date
+today = datetime.date.today()
+# Iterate through all the files in the goal directory, whose entries already hold their paths and, on Windows, their modification times
+for entry in os.scandir(goalDir):
+    if entry.name.endswith(".log"):
         # Get the time since the file was last modified, converting it into struct_time
-        modSec = os.path.getmtime(os.path.join(goalDir,file))
+        modSec = entry.stat().st_mtime
         lastModified = time.localtime(modSec)
-        # Get the current date
         dt = datetime.datetime(*lastModified[:6])
         # Remove any files older than yesterday
-        if (datetime.date.today() - dt.date()).days > 1:
-            logger.debug(f"Removing file {os.path.join(goalDir,file)}")
-            os.remove(os.path.join(goalDir,file))
+        if (today - dt.date()).days > 1:
+            logger.debug("Removing file {}", entry.path)
+            os.remove(entry.path)
 
 # Account for high DPI displays
 ctypes.windll.user32.SetProcessDPIAware()
@@ -73,6 +76,7 @@ pg.display.set_icon(pg.image.load(dirPath + "\\Assets\\Chess Icon.png").convert_
 
 # Set up game settings
 framerate = 60
+clock = pg.time.Clock()
 game = gam.Game(screenSize)
 
 # Run the game loop, ensuring that the it only runs when this file has been opened specifically
@@ -81,19 +85,18 @@ if __name__ == "__main__":
     logger.debug("Game loop started")
     while True:
 
-        startFrameTime = time.perf_counter()
+        # Classify the event queue in a single pass, which is shared by everything using it this cycle, and allow the game to be exited
+        events = inp.EventBundle(pg.event.get())
+        if events.getQuit():
+            quit("Thanks for playing!")
 
-        # Define a process to allow the game to be exited
-        events = pg.event.get()
-        for event in events:
-            if event.type == pg.QUIT:
-                quit("Thanks for playing!")
+        # Read the mouse state once, so that everything this cycle sees the same snapshot of it
+        mousePos = pg.Vector2(pg.mouse.get_pos())
+        leftMousePressed = pg.mouse.get_pressed()[0]
 
-        # Handle updating of the game logic and screen
-        game.update(events, screen)
-        pg.display.flip()
+        # Handle updating of the game logic and screen, only updating the parts of the display which have changed
+        dirtyRects = game.update(events, screen, mousePos, leftMousePressed)
+        pg.display.update(dirtyRects)
     
-        # Handle timing
-        endFrameTime = time.perf_counter()
-        # Give a delay if processing for the frame finished early
-        time.sleep(max((1.0 / framerate) + startFrameTime - endFrameTime, 0))
+        # Handle timing, giving a delay if processing for the frame finished early
+        clock.tick_busy_loop(framerate)